@@ -28,8 +28,9 @@ def main():
     
     # Normalize text
     normalizer = TextNormalizer(remove_fillers=True)
-    for seg in transcript.segments:
-        seg.text = normalizer.normalize(seg.text)
+    texts = normalizer.normalize_many([seg.text for seg in transcript.segments])
+    for seg, text in zip(transcript.segments, texts):
+        seg.text = text
     
     print("Normalized segments:")
     for seg in transcript.segments:
@@ -1,27 +1,58 @@
 """ASR (Automatic Speech Recognition) module using faster-whisper."""
 
 import logging
-from typing import List, Optional, Callable
-from faster_whisper import WhisperModel
+import os
+from pathlib import Path
+from typing import List, Optional, Callable, Union
+
+import numpy as np
+from faster_whisper import BatchedInferencePipeline, WhisperModel
 from .schemas import Segment, Transcript
 
 logger = logging.getLogger(__name__)
 
+ASR_BACKENDS = ("faster-whisper", "openvino")
+
+# Hugging Face checkpoints used by backends that don't read CTranslate2 models
+HF_MODEL_IDS = {
+    "tiny": "openai/whisper-tiny",
+    "base": "openai/whisper-base",
+    "small": "openai/whisper-small",
+    "medium": "openai/whisper-medium",
+    "large": "openai/whisper-large-v3",
+}
+
+OPENVINO_CACHE_DIR = Path.home() / ".cache" / "tcpcm" / "ov"
+
+
+def _describe_audio(audio: Union[str, np.ndarray]) -> str:
+    """Describe an audio input for log messages."""
+    if isinstance(audio, np.ndarray):
+        return f"{len(audio) / 16000:.1f}s of pre-decoded audio"
+    return audio
+
 
 def detect_device() -> tuple[str, str]:
     """
     Auto-detect the best device and compute type.
     
+    Queries CTranslate2 (the faster-whisper runtime) directly, so no
+    torch install is needed. On GPUs with bfloat16 support (Ampere or
+    newer) int8_bfloat16 is preferred over int8_float16.
+    
     Returns:
         Tuple of (device, compute_type)
     """
     try:
-        import torch
-        if torch.cuda.is_available():
+        import ctranslate2
+        if ctranslate2.get_cuda_device_count() > 0:
+            if "int8_bfloat16" in ctranslate2.get_supported_compute_types("cuda"):
+                logger.info("CUDA GPU with bfloat16 support detected, using GPU with int8_bfloat16")
+                return "cuda", "int8_bfloat16"
             logger.info("CUDA GPU detected, using GPU with int8_float16")
             return "cuda", "int8_float16"
-    except ImportError:
-        pass
+    except Exception as e:
+        logger.warning(f"CUDA detection failed: {e}")
     
     logger.info("No GPU detected, using CPU with int8")
     return "cpu", "int8"
@@ -30,6 +61,8 @@ def detect_device() -> tuple[str, str]:
 class ASREngine:
     """Wrapper around faster-whisper WhisperModel."""
     
+    backend = "faster-whisper"
+    
     def __init__(
         self,
         model_size: str = "medium",
@@ -37,16 +70,27 @@ class ASREngine:
         compute_type: Optional[str] = None,
         beam_size: int = 5,
         vad_filter: bool = True,
+        batch_size: Optional[int] = None,
+        cpu_threads: Optional[int] = None,
+        num_workers: Optional[int] = None,
     ):
         """
         Initialize ASR engine.
         
         Args:
             model_size: Whisper model size (tiny, base, small, medium, large)
+                or path to a CTranslate2-converted model directory
             device: Device to use (cpu, cuda). Auto-detect if None.
-            compute_type: Compute type. Auto-detect if None.
+            compute_type: Compute type / quantization (int8, int8_float16,
+                int8_bfloat16, float16, float32). Auto-detect if None.
             beam_size: Beam size for decoding
             vad_filter: Whether to use VAD filtering
+            batch_size: Number of VAD segments decoded together. Defaults to
+                8 on GPU and 1 (sequential decoding) on CPU.
+            cpu_threads: CTranslate2 threads used on CPU. Defaults to the
+                number of CPUs.
+            num_workers: Number of concurrent transcriptions the model can
+                run. Defaults to 1.
         """
         if device is None or compute_type is None:
             auto_device, auto_compute = detect_device()
@@ -58,17 +102,28 @@ class ASREngine:
         self.compute_type = compute_type
         self.beam_size = beam_size
         self.vad_filter = vad_filter
+        self.batch_size = batch_size if batch_size is not None else (8 if device == "cuda" else 1)
+        self.cpu_threads = cpu_threads or os.cpu_count() or 0
+        self.num_workers = num_workers or 1
         
         logger.info(f"Loading Whisper model: {model_size} on {device} with {compute_type}")
         self.model = WhisperModel(
             model_size,
             device=device,
-            compute_type=compute_type
+            compute_type=compute_type,
+            cpu_threads=self.cpu_threads,
+            num_workers=self.num_workers
         )
+        
+        # Batched decoding needs VAD to split the audio into independent chunks
+        if self.batch_size > 1 and vad_filter:
+            self.pipeline = BatchedInferencePipeline(model=self.model)
+        else:
+            self.pipeline = None
     
     def transcribe(
         self, 
-        audio_path: str, 
+        audio_path: Union[str, np.ndarray], 
         language: Optional[str] = None,
         progress_callback: Optional[Callable[[float, int], None]] = None,
         total_duration: Optional[float] = None
@@ -77,7 +132,8 @@ class ASREngine:
         Transcribe an audio/video file.
         
         Args:
-            audio_path: Path to audio or video file
+            audio_path: Path to audio or video file, or 16 kHz mono samples
+                already decoded with media.load_audio
             language: Language code (e.g., 'en'). Auto-detect if None.
             progress_callback: Optional callback function(current_time, segment_count)
             total_duration: Total duration in seconds (for progress estimation)
@@ -85,14 +141,27 @@ class ASREngine:
         Returns:
             Transcript object with segments
         """
-        logger.info(f"Transcribing: {audio_path}")
+        logger.info(f"Transcribing: {_describe_audio(audio_path)}")
         
-        segments_iter, info = self.model.transcribe(
-            audio_path,
-            language=language,
-            beam_size=self.beam_size,
-            vad_filter=self.vad_filter,
-        )
+        if self.pipeline is not None:
+            # The batched pipeline defaults to one segment per VAD chunk (up
+            # to ~30s); keep Whisper's timestamps so SRT/VTT cues are as fine
+            # as with sequential decoding
+            segments_iter, info = self.pipeline.transcribe(
+                audio_path,
+                language=language,
+                beam_size=self.beam_size,
+                vad_filter=self.vad_filter,
+                batch_size=self.batch_size,
+                without_timestamps=False,
+            )
+        else:
+            segments_iter, info = self.model.transcribe(
+                audio_path,
+                language=language,
+                beam_size=self.beam_size,
+                vad_filter=self.vad_filter,
+            )
         
         segments = []
         for i, segment in enumerate(segments_iter):
@@ -121,3 +190,172 @@ class ASREngine:
                    f"language={info.language}, duration={duration:.2f}s")
         
         return transcript
+
+
+class OpenVINOEngine:
+    """Whisper inference on Intel hardware via OpenVINO (optimum-intel)."""
+    
+    backend = "openvino"
+    
+    def __init__(
+        self,
+        model_size: str = "medium",
+        device: Optional[str] = None,
+        compute_type: Optional[str] = None,
+        beam_size: int = 5,
+        vad_filter: bool = True,
+        batch_size: Optional[int] = None,
+        cpu_threads: Optional[int] = None,
+        num_workers: Optional[int] = None,
+    ):
+        """
+        Initialize OpenVINO engine.
+        
+        The model is exported to OpenVINO IR on first use and cached under
+        ~/.cache/tcpcm/ov/. Weights are compressed to int8 unless a float
+        compute type is requested.
+        
+        Args:
+            model_size: Whisper model size (tiny, base, small, medium, large)
+                or a Hugging Face model id/path
+            device: OpenVINO device (CPU, GPU). Defaults to CPU.
+            compute_type: Compute type. Float types disable weight compression.
+            beam_size: Beam size for decoding
+            vad_filter: Unused; accepted for interface compatibility
+            batch_size: Number of 30s audio windows decoded together
+            cpu_threads: OpenVINO inference threads. Defaults to the number
+                of CPUs.
+            num_workers: Unused; accepted for interface compatibility
+        """
+        try:
+            from optimum.intel.openvino import OVModelForSpeechSeq2Seq, OVWeightQuantizationConfig
+            from transformers import AutoProcessor, pipeline
+        except ImportError as e:
+            raise ImportError(
+                "The openvino backend requires optimum-intel: "
+                "pip install 'tcpcm-transcriber[openvino]'"
+            ) from e
+        
+        model_id = HF_MODEL_IDS.get(model_size, model_size)
+        quantize = compute_type not in ("float16", "float32")
+        
+        self.model_size = model_size
+        self.device = (device or "CPU").upper()
+        self.compute_type = "int8" if quantize else compute_type
+        self.beam_size = beam_size
+        self.vad_filter = vad_filter
+        self.batch_size = batch_size or 1
+        self.cpu_threads = cpu_threads or os.cpu_count() or 0
+        self.num_workers = 1
+        
+        ov_config = {"INFERENCE_NUM_THREADS": str(self.cpu_threads)}
+        
+        cache_path = OPENVINO_CACHE_DIR / f"{Path(model_id).name}-{self.compute_type}"
+        if cache_path.exists():
+            logger.info(f"Loading cached OpenVINO model from {cache_path}")
+            model = OVModelForSpeechSeq2Seq.from_pretrained(cache_path, device=self.device, ov_config=ov_config)
+            processor = AutoProcessor.from_pretrained(cache_path)
+        else:
+            logger.info(f"Exporting {model_id} to OpenVINO ({self.compute_type}), this happens once")
+            model = OVModelForSpeechSeq2Seq.from_pretrained(
+                model_id,
+                export=True,
+                device=self.device,
+                ov_config=ov_config,
+                quantization_config=OVWeightQuantizationConfig(bits=8) if quantize else None,
+            )
+            processor = AutoProcessor.from_pretrained(model_id)
+            model.save_pretrained(cache_path)
+            processor.save_pretrained(cache_path)
+        
+        self.pipeline = pipeline(
+            "automatic-speech-recognition",
+            model=model,
+            tokenizer=processor.tokenizer,
+            feature_extractor=processor.feature_extractor,
+            chunk_length_s=30,
+        )
+    
+    def transcribe(
+        self, 
+        audio_path: Union[str, np.ndarray], 
+        language: Optional[str] = None,
+        progress_callback: Optional[Callable[[float, int], None]] = None,
+        total_duration: Optional[float] = None
+    ) -> Transcript:
+        """
+        Transcribe an audio/video file.
+        
+        Args:
+            audio_path: Path to audio or video file, or 16 kHz mono samples
+                already decoded with media.load_audio
+            language: Language code (e.g., 'en'). Auto-detect if None.
+            progress_callback: Optional callback function(current_time, segment_count)
+            total_duration: Total duration in seconds (for progress estimation)
+        
+        Returns:
+            Transcript object with segments
+        """
+        from faster_whisper import decode_audio
+        
+        logger.info(f"Transcribing with OpenVINO: {_describe_audio(audio_path)}")
+        
+        if isinstance(audio_path, np.ndarray):
+            audio = audio_path
+        else:
+            audio = decode_audio(audio_path, sampling_rate=16000)
+        generate_kwargs = {"num_beams": self.beam_size}
+        if language:
+            generate_kwargs["language"] = language
+        
+        result = self.pipeline(
+            {"raw": audio, "sampling_rate": 16000},
+            return_timestamps=True,
+            batch_size=self.batch_size,
+            generate_kwargs=generate_kwargs,
+        )
+        
+        audio_duration = len(audio) / 16000
+        segments = []
+        for i, piece in enumerate(result.get("chunks", [])):
+            start, end = piece["timestamp"]
+            seg = Segment(
+                id=i,
+                start=float(start),
+                end=float(end) if end is not None else audio_duration,
+                text=piece["text"].strip()
+            )
+            segments.append(seg)
+            
+            if progress_callback:
+                progress_callback(seg.end, len(segments))
+        
+        duration = segments[-1].end if segments else 0.0
+        
+        transcript = Transcript(
+            segments=segments,
+            language=language,
+            duration=duration
+        )
+        
+        logger.info(f"Transcription complete: {len(segments)} segments, duration={duration:.2f}s")
+        
+        return transcript
+
+
+def create_engine(backend: str = "faster-whisper", **kwargs):
+    """
+    Create an ASR engine for the given backend.
+    
+    Args:
+        backend: One of ASR_BACKENDS
+        **kwargs: Engine arguments (model_size, device, compute_type, ...)
+    
+    Returns:
+        Engine exposing transcribe(audio_path, language, progress_callback, total_duration)
+    """
+    if backend == "faster-whisper":
+        return ASREngine(**kwargs)
+    if backend == "openvino":
+        return OpenVINOEngine(**kwargs)
+    raise ValueError(f"Unknown ASR backend: {backend}")
@@ -1,12 +1,52 @@
 """Text chunking utilities for RAG ingestion with timestamp preservation."""
 
 import logging
-from typing import List
+import math
+from typing import Iterator, List, Tuple
+
+import numpy as np
+
 from .schemas import Segment, Chunk
 
 logger = logging.getLogger(__name__)
 
 
+def _window_map(
+    seg_start_chars: np.ndarray,
+    text_len: int,
+    target_chars: int,
+    stride: int
+) -> Tuple[List[int], List[int], List[int], List[int]]:
+    """
+    Compute every sliding window and the segments it covers in one pass.
+    
+    The window count is fixed up front and the last window is aligned to
+    the end of the text, so the final chunk is full length rather than a
+    short tail fragment. Each window covers the segments containing its
+    first and last character, and all segments in between.
+    
+    Args:
+        seg_start_chars: Sorted start offset of each segment in the text
+        text_len: Length of the combined text
+        target_chars: Window size in characters
+        stride: Distance between window starts in characters
+    
+    Returns:
+        Tuple of (window starts, window ends, first segment index,
+        last segment index), one entry per window
+    """
+    num_windows = max(1, math.ceil((text_len - target_chars) / stride) + 1)
+    last_window_start = max(0, text_len - target_chars)
+    last_seg = len(seg_start_chars) - 1
+    
+    starts = np.minimum(np.arange(num_windows, dtype=np.int64) * stride, last_window_start)
+    ends = np.minimum(starts + target_chars, text_len)
+    first_idx = np.clip(np.searchsorted(seg_start_chars, starts, side='right') - 1, 0, last_seg)
+    last_idx = np.clip(np.searchsorted(seg_start_chars, ends - 1, side='right') - 1, 0, last_seg)
+    
+    return starts.tolist(), ends.tolist(), first_idx.tolist(), last_idx.tolist()
+
+
 class TextChunker:
     """Character-window based text chunker that preserves timestamps."""
     
@@ -44,77 +84,63 @@ class TextChunker:
         Returns:
             List of chunks with metadata
         """
-        if not segments:
-            return []
+        return list(self.iter_chunks(segments, source_file))
+    
+    def iter_chunks(
+        self,
+        segments: List[Segment],
+        source_file: str = None
+    ) -> Iterator[Chunk]:
+        """
+        Lazily generate overlapping text chunks.
         
-        chunks = []
-        chunk_id = 0
+        Chunks are built one at a time as they are consumed, so streaming
+        them into an exporter never holds the full chunk list in memory.
         
-        # Combine all segments into one text with tracking
-        full_text = ""
-        char_to_segment = []  # Maps character index to segment
+        Args:
+            segments: List of transcription segments
+            source_file: Source file name for metadata
         
-        for seg in segments:
-            seg_start_char = len(full_text)
-            seg_text = seg.text + " "  # Add space between segments
-            full_text += seg_text
-            
-            # Track which segment each character belongs to
-            for _ in range(len(seg_text)):
-                char_to_segment.append(seg)
+        Yields:
+            Chunks with metadata
+        """
+        if not segments:
+            return
         
-        full_text = full_text.strip()
+        chunk_id = 0
         
-        # Create chunks with sliding window
-        start_char = 0
+        # Combine all segments into one text, remembering where each segment
+        # starts so character offsets can be mapped back to segments.
+        # The text is built with a single join and is not stripped, so these
+        # offsets stay aligned with it; each chunk's text is stripped instead.
+        texts = [seg.text for seg in segments]
+        full_text = " ".join(texts)
+        seg_lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts)) + 1  # +1 for separator
+        seg_start_chars = np.concatenate(([0], np.cumsum(seg_lengths)[:-1]))
+        seg_ids = [seg.id for seg in segments]
         
-        while start_char < len(full_text):
-            end_char = min(start_char + self.target_chars, len(full_text))
-            
+        windows = _window_map(seg_start_chars, len(full_text), self.target_chars, self.stride)
+        
+        for start_char, end_char, first_idx, last_idx in zip(*windows):
             # Extract chunk text
             chunk_text = full_text[start_char:end_char].strip()
             
-            if not chunk_text:
-                break
-            
-            # Find segments that contributed to this chunk
-            # Use dict to track unique segments by id
-            chunk_segments_dict = {}
-            for i in range(start_char, min(end_char, len(char_to_segment))):
-                if i < len(char_to_segment):
-                    seg = char_to_segment[i]
-                    chunk_segments_dict[seg.id] = seg
-            
-            chunk_segments = sorted(chunk_segments_dict.values(), key=lambda s: s.id)
-            
-            if chunk_segments:
-                # Get timestamps from first and last segment in chunk
-                chunk_start = chunk_segments[0].start
-                chunk_end = chunk_segments[-1].end
-                segment_ids = [seg.id for seg in chunk_segments]
-                
+            # Whitespace-only windows (e.g. from empty segments) are skipped
+            if chunk_text:
                 chunk = Chunk(
                     chunk_id=chunk_id,
                     text=chunk_text,
-                    start=chunk_start,
-                    end=chunk_end,
-                    segment_ids=segment_ids,
-                    char_count=len(chunk_text),
+                    start=segments[first_idx].start,
+                    end=segments[last_idx].end,
+                    segment_ids=seg_ids[first_idx:last_idx + 1],
                     source_file=source_file
                 )
                 
-                chunks.append(chunk)
+                yield chunk
                 chunk_id += 1
-            
-            # Move window forward
-            start_char += self.stride
-            
-            # Stop if we've reached the end
-            if end_char >= len(full_text):
-                break
         
-        logger.info(f"Created {len(chunks)} chunks from {len(segments)} segments")
-        return chunks
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Created {chunk_id} chunks from {len(segments)} segments")
 
 
 def chunk_transcript(
@@ -1,36 +1,292 @@
 """Command-line interface for TcPCM Transcriber."""
 
 import logging
+import multiprocessing
+import os
+import re
+import socket
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterable, Optional
+
+# CTranslate2 sizes its own thread pool (--cpu-threads); keep NumPy/OpenBLAS
+# single-threaded so the two don't oversubscribe the cores. Must be set
+# before numpy is imported.
+os.environ.setdefault("OMP_NUM_THREADS", "1")
 
 import click
+from click.core import ParameterSource
 from rich.console import Console
 from rich.logging import RichHandler
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from .asr import ASREngine
-from .media import validate_media_file, probe_media
-from .normalize import TextNormalizer
+from .asr import ASR_BACKENDS, ASREngine, create_engine
+from .media import load_audio, validate_media_file, probe_media
+from .normalize import TextNormalizer, get_default_normalizer
 from .chunk import TextChunker
 from .export import export_all, export_formats
 
-# Setup logging with rich
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(message)s",
-    handlers=[RichHandler(rich_tracebacks=True)]
-)
 logger = logging.getLogger(__name__)
 console = Console()
 
 
+def _setup_logging(level: int = logging.INFO) -> None:
+    """Route logging through rich; called from the CLI entry point, not at import."""
+    logging.basicConfig(
+        level=level,
+        format="%(message)s",
+        handlers=[RichHandler(rich_tracebacks=True, markup=False, show_time=False)],
+        force=True
+    )
+
+
+# Chapter number in input file names, e.g. "TcPCM Ch 1" -> tcpcm_ch01
+_CHAPTER_RE = re.compile(r'ch\s*(\d+)', re.IGNORECASE)
+
+# Per-process pipeline used by batch worker processes
+_worker_pipeline: Dict[str, Any] = {}
+
+# transcribe options that configure the engine, mapped to the setting names
+# the model server reports (see server.ENGINE_SETTINGS)
+_ENGINE_OPTIONS = {
+    "backend": "backend",
+    "compute_type": "compute_type",
+    "beam_size": "beam_size",
+    "vad": "vad_filter",
+    "batch_size": "batch_size",
+    "cpu_threads": "cpu_threads",
+    "num_workers": "num_workers",
+}
+
+
+def _output_stem(input_file: str) -> str:
+    """Build the output base name for an input file (e.g. tcpcm_ch01)."""
+    input_stem = Path(input_file).stem
+    # Sanitize filename: remove spaces, convert to lowercase, prefix with tcpcm_
+    safe_stem = "tcpcm_" + input_stem.lower().replace(" ", "_")
+    # Simplify if it contains "ch" and numbers
+    match = _CHAPTER_RE.search(input_stem)
+    if match:
+        safe_stem = f"tcpcm_ch{match.group(1).zfill(2)}"
+    return safe_stem
+
+
+def _process_file(
+    asr: ASREngine,
+    input_file: str,
+    output_dir: str,
+    normalizer: Optional[TextNormalizer],
+    chunker: TextChunker,
+    language: Optional[str] = None,
+    formats: Optional[Iterable[str]] = None,
+    total_duration: Optional[float] = None,
+    show_progress: bool = True,
+    audio: Optional[Any] = None,
+) -> Dict[str, str]:
+    """
+    Transcribe, normalize, chunk and export a single file with a loaded engine.
+    
+    Args:
+        asr: Loaded ASR engine
+        input_file: Path to the audio or video file
+        output_dir: Output directory
+        normalizer: Text normalizer, or None to skip normalization
+        chunker: Text chunker
+        language: Language code. Auto-detect if None.
+        formats: Export formats. All formats if empty or containing "all".
+        total_duration: Media duration in seconds, enables the progress bar
+        show_progress: Whether to print progress to the console
+        audio: Pre-decoded samples from load_audio; decoded from input_file if None
+    
+    Returns:
+        Dictionary mapping format to output path
+    """
+    audio_input = audio if audio is not None else input_file
+    
+    if total_duration and show_progress:
+        from rich.progress import BarColumn, TimeRemainingColumn
+        with Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            TextColumn("•"),
+            TextColumn("{task.fields[segments]} segments"),
+            TimeRemainingColumn(),
+            console=console
+        ) as progress:
+            task = progress.add_task(
+                "Transcribing...", 
+                total=total_duration,
+                segments=0
+            )
+            
+            def update_progress(current_time: float, segment_count: int):
+                progress.update(task, completed=min(current_time, total_duration), segments=segment_count)
+            
+            transcript = asr.transcribe(
+                audio_input, 
+                language=language,
+                progress_callback=update_progress,
+                total_duration=total_duration
+            )
+    else:
+        if show_progress:
+            console.print("Transcribing... (this may take a while)")
+        transcript = asr.transcribe(audio_input, language=language)
+    
+    if show_progress:
+        console.print(f"[green]✓[/green] Transcribed {len(transcript.segments)} segments")
+    
+    # Normalize text if requested
+    if normalizer is not None:
+        texts = normalizer.normalize_segments([seg.text for seg in transcript.segments])
+        for seg, text in zip(transcript.segments, texts):
+            seg.text = text
+        if show_progress:
+            console.print("[green]✓[/green] Text normalized")
+    
+    # Create chunks lazily; they are streamed straight into the JSONL export
+    # (and never built if JSONL isn't selected)
+    source_file = Path(input_file).name
+    chunk_count = 0
+    
+    def counted_chunks():
+        nonlocal chunk_count
+        for chunk in chunker.iter_chunks(transcript.segments, source_file=source_file):
+            chunk_count += 1
+            yield chunk
+    
+    # Export selected formats (default: all)
+    safe_stem = _output_stem(input_file)
+    selected = set((f.lower() for f in (formats or ())))
+    if not selected or 'all' in selected:
+        outputs = export_all(transcript, counted_chunks(), output_dir, safe_stem)
+    else:
+        outputs = export_formats(transcript, counted_chunks(), output_dir, safe_stem, selected)
+    
+    if show_progress and 'jsonl' in outputs:
+        console.print(f"[green]✓[/green] Created {chunk_count} RAG chunks")
+    return outputs
+
+
+def _connect_server(
+    model_name: str,
+    settings: Optional[Dict[str, Any]] = None,
+    socket_path: Optional[Path] = None
+) -> Optional[Any]:
+    """
+    Connect to a running `tcpcm serve` model server holding model_name.
+    
+    Args:
+        model_name: Model size or resolved model path
+        settings: Engine settings the user asked for explicitly, keyed as
+            in server.ENGINE_SETTINGS. The server is only used if its
+            engine has the same values.
+        socket_path: Server socket (default: server.SOCKET_PATH)
+    
+    Returns:
+        RemoteEngine, or None if the model should be loaded locally
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    
+    from .server import SOCKET_PATH, connect
+    
+    remote = connect(socket_path or SOCKET_PATH)
+    if remote is None:
+        return None
+    if remote.model_size != model_name:
+        console.print(f"[yellow]Model server holds '{remote.model_size}', loading '{model_name}' locally[/yellow]")
+        remote.close()
+        return None
+    
+    mismatched = [
+        f"{name}={remote.info.get(name)}"
+        for name, value in (settings or {}).items()
+        if remote.info.get(name) != value
+    ]
+    if mismatched:
+        console.print(
+            f"[yellow]Model server runs with {', '.join(mismatched)}, "
+            f"loading '{model_name}' locally[/yellow]"
+        )
+        remote.close()
+        return None
+    return remote
+
+
+def _init_batch_worker(
+    engine_kwargs: Dict[str, Any],
+    normalize: bool,
+    device_queue: Any,
+) -> None:
+    """Load one ASR engine per worker process, pinned to its GPU if any."""
+    _setup_logging(logging.WARNING)
+    
+    device_id = device_queue.get()
+    if device_id is not None:
+        os.environ["CUDA_VISIBLE_DEVICES"] = device_id
+    
+    _worker_pipeline["asr"] = ASREngine(**engine_kwargs)
+    _worker_pipeline["normalizer"] = get_default_normalizer() if normalize else None
+    _worker_pipeline["chunker"] = TextChunker()
+
+
+def _run_batch_worker(input_file: str, output_dir: str) -> Dict[str, str]:
+    """Process one file with the worker's preloaded pipeline."""
+    return _process_file(
+        _worker_pipeline["asr"],
+        input_file,
+        output_dir,
+        _worker_pipeline["normalizer"],
+        _worker_pipeline["chunker"],
+        show_progress=False,
+    )
+
+
+def _batch_parallel(
+    files: list,
+    output_dir: str,
+    model: str,
+    normalize: bool,
+    workers: int,
+    cpu_threads: Optional[int] = None
+) -> list:
+    """Process files across worker processes; returns names of failed files."""
+    import ctranslate2
+    
+    # Pin worker k to GPU k (round-robin) when CUDA devices are present
+    gpu_count = ctranslate2.get_cuda_device_count()
+    mp_context = multiprocessing.get_context("spawn")
+    device_queue = mp_context.Queue()
+    for k in range(workers):
+        device_queue.put(str(k % gpu_count) if gpu_count else None)
+    
+    failed = []
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp_context,
+        initializer=_init_batch_worker,
+        initargs=({"model_size": model, "cpu_threads": cpu_threads}, normalize, device_queue),
+    ) as pool:
+        futures = {pool.submit(_run_batch_worker, str(f), output_dir): f for f in files}
+        for done, future in enumerate(as_completed(futures), 1):
+            file = futures[future]
+            try:
+                future.result()
+                console.print(f"[green]✓[/green] {done}/{len(files)}: {file.name}")
+            except Exception as e:
+                logger.error(f"Failed to process {file.name}: {e}")
+                failed.append(file.name)
+    return failed
+
+
 @click.group()
 @click.version_option(version="0.1.0")
 def cli():
     """TcPCM Transcriber - Transcribe training videos with Whisper."""
-    pass
+    _setup_logging()
 
 
 @cli.command()
@@ -43,9 +299,16 @@ def cli():
               default='medium',
               type=click.Choice(['tiny', 'base', 'small', 'medium', 'large']),
               help='Whisper model size')
-@click.option('--compute-type', 
-              type=click.Choice(['int8', 'int8_float16', 'float16', 'float32']),
-              help='Compute type (auto-detect if not specified)')
+@click.option('--model-path',
+              type=click.Path(exists=True, file_okay=False),
+              help='Path to a CTranslate2-converted Whisper model (overrides --model)')
+@click.option('--backend',
+              default='faster-whisper',
+              type=click.Choice(ASR_BACKENDS),
+              help='Inference backend (openvino requires the [openvino] extra)')
+@click.option('--compute-type', '--quantization', 'compute_type',
+              type=click.Choice(['int8', 'int8_float16', 'int8_bfloat16', 'float16', 'float32']),
+              help='Compute type / quantization (auto-detect if not specified)')
 @click.option('--beam-size', 
               type=int, 
               default=5,
@@ -53,6 +316,19 @@ def cli():
 @click.option('--vad/--novad', 
               default=True,
               help='Use VAD filtering')
+@click.option('--batch-size',
+              type=click.IntRange(min=1),
+              help='Audio chunks decoded together (default: 8 on GPU, 1 on CPU). Requires VAD.')
+@click.option('--cpu-threads',
+              type=click.IntRange(min=1),
+              help='Inference threads on CPU (default: number of CPUs)')
+@click.option('--num-workers',
+              type=click.IntRange(min=1),
+              default=1,
+              help='Concurrent transcriptions the loaded model can run')
+@click.option('--server/--no-server', 'use_server',
+              default=True,
+              help='Use a running `tcpcm serve` model server if it holds the requested model and settings')
 @click.option('--normalize/--no-normalize', 
               default=True,
               help='Apply text normalization')
@@ -77,9 +353,15 @@ def transcribe(
     input_file: str,
     output_dir: str,
     model: str,
+    model_path: Optional[str],
+    backend: str,
     compute_type: Optional[str],
     beam_size: int,
     vad: bool,
+    batch_size: Optional[int],
+    cpu_threads: Optional[int],
+    num_workers: int,
+    use_server: bool,
     normalize: bool,
     glossary: Optional[str],
     target_chars: int,
@@ -98,90 +380,65 @@ def transcribe(
             console.print("[bold red]Error:[/bold red] Invalid input file")
             sys.exit(1)
         
-        # Probe media (optional)
-        media_info = probe_media(input_file)
-        if media_info:
-            console.print(f"Duration: {media_info.get('duration', 'unknown')}s")
-        
-        # Initialize ASR engine
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            progress.add_task(description="Loading Whisper model...", total=None)
-            asr = ASREngine(
-                model_size=model,
-                device=None if compute_type is None else 'cuda' if 'cuda' in compute_type else 'cpu',
-                compute_type=compute_type,
-                beam_size=beam_size,
-                vad_filter=vad
-            )
-        
-        # Transcribe with progress bar
-        total_duration = media_info.get('duration') if media_info else None
-        
-        if total_duration:
-            from rich.progress import BarColumn, TimeRemainingColumn
-            with Progress(
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                TextColumn("•"),
-                TextColumn("{task.fields[segments]} segments"),
-                TimeRemainingColumn(),
-                console=console
-            ) as progress:
-                task = progress.add_task(
-                    "Transcribing...", 
-                    total=total_duration,
-                    segments=0
-                )
-                
-                def update_progress(current_time: float, segment_count: int):
-                    progress.update(task, completed=min(current_time, total_duration), segments=segment_count)
-                
-                transcript = asr.transcribe(
-                    input_file, 
-                    language=language,
-                    progress_callback=update_progress,
-                    total_duration=total_duration
-                )
-        else:
-            console.print("Transcribing... (this may take a while)")
-            transcript = asr.transcribe(input_file, language=language)
-        
-        console.print(f"[green]✓[/green] Transcribed {len(transcript.segments)} segments")
+        # Reuse the model held by a running model server, if any
+        model_name = str(Path(model_path).resolve()) if model_path else model
+        asr = None
+        if use_server:
+            # Only options given on the command line have to match the server
+            ctx = click.get_current_context()
+            settings = {
+                name: ctx.params[option]
+                for option, name in _ENGINE_OPTIONS.items()
+                if ctx.get_parameter_source(option) is not ParameterSource.DEFAULT
+            }
+            asr = _connect_server(model_name, settings)
+        if asr is not None:
+            console.print(f"Using model server ({asr.model_size} on {asr.device})")
         
-        # Normalize text if requested
-        if normalize:
-            normalizer = TextNormalizer(glossary_path=glossary)
-            for seg in transcript.segments:
-                seg.text = normalizer.normalize(seg.text)
-            console.print("[green]✓[/green] Text normalized")
+        # Probe media (optional) and decode audio in the background while
+        # the model loads. The model server decodes the audio itself.
+        with ThreadPoolExecutor(max_workers=2) as background:
+            probe_future = background.submit(probe_media, input_file)
+            audio_future = background.submit(load_audio, input_file) if asr is None else None
+            
+            # Initialize ASR engine
+            if asr is None:
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    console=console
+                ) as progress:
+                    progress.add_task(description="Loading Whisper model...", total=None)
+                    asr = create_engine(
+                        backend,
+                        model_size=model_name,
+                        compute_type=compute_type,
+                        beam_size=beam_size,
+                        vad_filter=vad,
+                        batch_size=batch_size,
+                        cpu_threads=cpu_threads,
+                        num_workers=num_workers
+                    )
+            
+            media_info = probe_future.result()
+            if media_info:
+                console.print(f"Duration: {media_info.get('duration', 'unknown')}s")
+            audio = audio_future.result() if audio_future else None
         
-        # Create chunks
+        normalizer = TextNormalizer(glossary_path=glossary) if normalize else None
         chunker = TextChunker(target_chars=target_chars, overlap_chars=overlap_chars)
-        source_file = Path(input_file).name
-        chunks = chunker.chunk_segments(transcript.segments, source_file=source_file)
-        console.print(f"[green]✓[/green] Created {len(chunks)} RAG chunks")
-        
-        # Generate output filename
-        input_stem = Path(input_file).stem
-        # Sanitize filename: remove spaces, convert to lowercase, prefix with tcpcm_
-        safe_stem = "tcpcm_" + input_stem.lower().replace(" ", "_")
-        # Simplify if it contains "ch" and numbers
-        import re
-        match = re.search(r'ch\s*(\d+)', input_stem, re.IGNORECASE)
-        if match:
-            safe_stem = f"tcpcm_ch{match.group(1).zfill(2)}"
         
-        # Export selected formats (default: all)
-        selected = set((f.lower() for f in (formats or ())))
-        if not selected or 'all' in selected:
-            outputs = export_all(transcript, chunks, output_dir, safe_stem)
-        else:
-            outputs = export_formats(transcript, chunks, output_dir, safe_stem, selected)
+        outputs = _process_file(
+            asr,
+            input_file,
+            output_dir,
+            normalizer,
+            chunker,
+            language=language,
+            formats=formats,
+            total_duration=media_info.get('duration') if media_info else None,
+            audio=audio,
+        )
         
         console.print(f"\n[bold green]Transcription complete![/bold green]")
         console.print(f"Output directory: {output_dir}")
@@ -210,12 +467,21 @@ def transcribe(
 @click.option('--normalize/--no-normalize', 
               default=True,
               help='Apply text normalization')
+@click.option('--workers',
+              type=click.IntRange(min=1),
+              default=1,
+              help='Worker processes, each with its own model (one per GPU on multi-GPU hosts)')
+@click.option('--cpu-threads',
+              type=click.IntRange(min=1),
+              help='Inference threads per worker on CPU (default: CPUs divided among workers)')
 def batch(
     input_dir: str,
     output_dir: str,
     pattern: str,
     model: str,
-    normalize: bool
+    normalize: bool,
+    workers: int,
+    cpu_threads: Optional[int]
 ):
     """Batch transcribe multiple files in a directory."""
     
@@ -230,28 +496,63 @@ def batch(
         console.print(f"[bold blue]TcPCM Transcriber - Batch Mode[/bold blue]")
         console.print(f"Found {len(files)} files to process")
         
-        for i, file in enumerate(files, 1):
-            console.print(f"\n[bold]Processing {i}/{len(files)}:[/bold] {file.name}")
-            
-            # Call transcribe for each file
-            ctx = click.get_current_context()
-            ctx.invoke(
-                transcribe,
-                input_file=str(file),
-                output_dir=output_dir,
-                model=model,
-                compute_type=None,
-                beam_size=5,
-                vad=True,
-                normalize=normalize,
-                glossary=None,
-                target_chars=1200,
-                overlap_chars=200,
-                language=None
-            )
+        # Per-file progress is shown on the console; keep logs to warnings
+        logging.getLogger().setLevel(logging.WARNING)
+        
+        files = [f for f in files if validate_media_file(str(f))]
+        failed = []
+        
+        # Share the cores between worker processes instead of letting each
+        # one spawn a thread per CPU
+        if cpu_threads is None:
+            cpu_threads = max(1, (os.cpu_count() or 1) // workers)
+        
+        if workers > 1:
+            failed = _batch_parallel(files, output_dir, model, normalize, workers, cpu_threads)
+        elif files:
+            # Decode the next file's audio in the background while the model
+            # loads and while the current file is transcribed
+            with ThreadPoolExecutor(max_workers=1) as decoder:
+                audio_future = decoder.submit(load_audio, str(files[0]))
+                
+                # Load the model once and reuse it for every file
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    console=console
+                ) as progress:
+                    progress.add_task(description="Loading Whisper model...", total=None)
+                    asr = ASREngine(model_size=model, cpu_threads=cpu_threads)
+                normalizer = get_default_normalizer() if normalize else None
+                chunker = TextChunker()
+                
+                for i, file in enumerate(files, 1):
+                    console.print(f"\n[bold]Processing {i}/{len(files)}:[/bold] {file.name}")
+                    audio = audio_future.result()
+                    if i < len(files):
+                        audio_future = decoder.submit(load_audio, str(files[i]))
+                    
+                    media_info = probe_media(str(file))
+                    try:
+                        _process_file(
+                            asr,
+                            str(file),
+                            output_dir,
+                            normalizer,
+                            chunker,
+                            total_duration=media_info.get('duration') if media_info else None,
+                            audio=audio,
+                        )
+                    except Exception:
+                        logger.exception(f"Failed to process {file.name}")
+                        failed.append(file.name)
+                    del audio
         
         console.print(f"\n[bold green]Batch processing complete![/bold green]")
-        console.print(f"Processed {len(files)} files")
+        console.print(f"Processed {len(files) - len(failed)} files")
+        if failed:
+            console.print(f"[bold red]Failed:[/bold red] {', '.join(failed)}")
+            sys.exit(1)
         
     except Exception as e:
         logger.exception("Batch processing failed")
@@ -259,5 +560,86 @@ def batch(
         sys.exit(1)
 
 
+@cli.command()
+@click.option('--model', '-m', 
+              default='medium',
+              type=click.Choice(['tiny', 'base', 'small', 'medium', 'large']),
+              help='Whisper model size')
+@click.option('--model-path',
+              type=click.Path(exists=True, file_okay=False),
+              help='Path to a CTranslate2-converted Whisper model (overrides --model)')
+@click.option('--backend',
+              default='faster-whisper',
+              type=click.Choice(ASR_BACKENDS),
+              help='Inference backend (openvino requires the [openvino] extra)')
+@click.option('--compute-type', '--quantization', 'compute_type',
+              type=click.Choice(['int8', 'int8_float16', 'int8_bfloat16', 'float16', 'float32']),
+              help='Compute type / quantization (auto-detect if not specified)')
+@click.option('--beam-size', 
+              type=int, 
+              default=5,
+              help='Beam size for decoding')
+@click.option('--vad/--novad', 
+              default=True,
+              help='Use VAD filtering')
+@click.option('--batch-size',
+              type=click.IntRange(min=1),
+              help='Audio chunks decoded together (default: 8 on GPU, 1 on CPU). Requires VAD.')
+@click.option('--cpu-threads',
+              type=click.IntRange(min=1),
+              help='Inference threads on CPU (default: number of CPUs)')
+@click.option('--socket', 'socket_path',
+              type=click.Path(dir_okay=False),
+              help='Socket path (default: ~/.cache/tcpcm/sock)')
+def serve(
+    model: str,
+    model_path: Optional[str],
+    backend: str,
+    compute_type: Optional[str],
+    beam_size: int,
+    vad: bool,
+    batch_size: Optional[int],
+    cpu_threads: Optional[int],
+    socket_path: Optional[str]
+):
+    """Keep a model loaded and serve transcriptions over a local socket."""
+    
+    if not hasattr(socket, "AF_UNIX"):
+        console.print("[bold red]Error:[/bold red] The model server needs Unix domain sockets")
+        sys.exit(1)
+    
+    from .server import SOCKET_PATH, ModelServer
+    
+    try:
+        model_name = str(Path(model_path).resolve()) if model_path else model
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console
+        ) as progress:
+            progress.add_task(description="Loading Whisper model...", total=None)
+            asr = create_engine(
+                backend,
+                model_size=model_name,
+                compute_type=compute_type,
+                beam_size=beam_size,
+                vad_filter=vad,
+                batch_size=batch_size,
+                cpu_threads=cpu_threads
+            )
+        
+        with ModelServer(asr, socket_path or SOCKET_PATH) as server:
+            console.print(f"[bold blue]TcPCM Transcriber - Model Server[/bold blue]")
+            console.print(f"Serving {model_name} on {server.socket_path} (Ctrl+C to stop)")
+            server.serve_forever()
+        
+    except KeyboardInterrupt:
+        console.print("\nModel server stopped")
+    except Exception as e:
+        logger.exception("Model server failed")
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+
+
 if __name__ == '__main__':
     cli()
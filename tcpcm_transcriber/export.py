@@ -2,12 +2,59 @@
 
 import json
 import logging
+from contextlib import ExitStack
+from dataclasses import asdict
 from pathlib import Path
-from typing import List, Iterable, Dict
+from typing import List, Iterable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .schemas import Segment, Transcript, Chunk
 
 logger = logging.getLogger(__name__)
 
+# Write buffer for streamed exports
+_WRITE_BUFFER = 1 << 20
+
+
+def _format_timestamp(seconds: float, separator: str) -> str:
+    """Format a single timestamp as HH:MM:SS<separator>mmm."""
+    total_ms = round(seconds * 1000)
+    hours, rem = divmod(total_ms, 3_600_000)
+    minutes, rem = divmod(rem, 60_000)
+    secs, millis = divmod(rem, 1000)
+    
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millis:03d}"
+
+
+def _split_timestamps(values: Sequence[float]) -> Tuple[List[str], List[str]]:
+    """
+    Split many timestamps at once into "HH:MM:SS" and "mmm" parts.
+    
+    The hour/minute/second/millisecond split is done with vectorized
+    integer arithmetic so the per-timestamp Python work is a single f-string.
+    Keeping the parts separate lets SRT and VTT share one split.
+    
+    Args:
+        values: Times in seconds
+    
+    Returns:
+        Tuple of (HH:MM:SS strings, millisecond strings)
+    """
+    total_ms = np.rint(np.asarray(values, dtype=np.float64) * 1000).astype(np.int64)
+    hours = (total_ms // 3_600_000).tolist()
+    minutes = ((total_ms // 60_000) % 60).tolist()
+    secs = ((total_ms // 1000) % 60).tolist()
+    millis = (total_ms % 1000).tolist()
+    
+    hms = [f"{h:02d}:{m:02d}:{s:02d}" for h, m, s in zip(hours, minutes, secs)]
+    return hms, [f"{ms:03d}" for ms in millis]
+
 
 def format_timestamp_srt(seconds: float) -> str:
     """
@@ -19,12 +66,7 @@ def format_timestamp_srt(seconds: float) -> str:
     Returns:
         Formatted timestamp string
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
-    
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+    return _format_timestamp(seconds, ",")
 
 
 def format_timestamp_vtt(seconds: float) -> str:
@@ -37,12 +79,47 @@ def format_timestamp_vtt(seconds: float) -> str:
     Returns:
         Formatted timestamp string
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
+    return _format_timestamp(seconds, ".")
+
+
+def _write_subtitles(
+    segments: List[Segment],
+    srt_path: Optional[str] = None,
+    vtt_path: Optional[str] = None
+) -> None:
+    """
+    Stream SRT and/or VTT files in a single pass over the segments.
+    
+    Entries are written straight to buffered file handles instead of being
+    joined into one string first, so memory use doesn't grow with the
+    output size.
+    
+    Args:
+        segments: List of transcription segments
+        srt_path: SRT output file path, or None to skip SRT
+        vtt_path: VTT output file path, or None to skip VTT
+    """
+    start_hms, start_ms = _split_timestamps([seg.start for seg in segments])
+    end_hms, end_ms = _split_timestamps([seg.end for seg in segments])
     
-    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+    with ExitStack() as stack:
+        srt_f = vtt_f = None
+        if srt_path is not None:
+            srt_f = stack.enter_context(open(srt_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER))
+        if vtt_path is not None:
+            vtt_f = stack.enter_context(open(vtt_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER))
+            vtt_f.write("WEBVTT\n")  # VTT header
+        
+        for i, seg in enumerate(segments):
+            t0, t1 = start_hms[i], end_hms[i]
+            ms0, ms1 = start_ms[i], end_ms[i]
+            # Entries are separated by an empty line
+            if srt_f is not None:
+                if i:
+                    srt_f.write("\n")
+                srt_f.write(f"{i + 1}\n{t0},{ms0} --> {t1},{ms1}\n{seg.text}\n")
+            if vtt_f is not None:
+                vtt_f.write(f"\n{t0}.{ms0} --> {t1}.{ms1}\n{seg.text}\n")
 
 
 def export_srt(segments: List[Segment], output_path: str) -> None:
@@ -53,18 +130,9 @@ def export_srt(segments: List[Segment], output_path: str) -> None:
         segments: List of transcription segments
         output_path: Output file path
     """
-    lines = []
-    
-    for i, seg in enumerate(segments, start=1):
-        lines.append(str(i))
-        lines.append(f"{format_timestamp_srt(seg.start)} --> {format_timestamp_srt(seg.end)}")
-        lines.append(seg.text)
-        lines.append("")  # Empty line between entries
-    
-    output = "\n".join(lines)
-    
-    Path(output_path).write_text(output, encoding='utf-8')
-    logger.info(f"Exported SRT to: {output_path}")
+    _write_subtitles(segments, srt_path=output_path)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Exported SRT to: {output_path}")
 
 
 def export_vtt(segments: List[Segment], output_path: str) -> None:
@@ -75,17 +143,9 @@ def export_vtt(segments: List[Segment], output_path: str) -> None:
         segments: List of transcription segments
         output_path: Output file path
     """
-    lines = ["WEBVTT", ""]  # VTT header
-    
-    for seg in segments:
-        lines.append(f"{format_timestamp_vtt(seg.start)} --> {format_timestamp_vtt(seg.end)}")
-        lines.append(seg.text)
-        lines.append("")  # Empty line between entries
-    
-    output = "\n".join(lines)
-    
-    Path(output_path).write_text(output, encoding='utf-8')
-    logger.info(f"Exported VTT to: {output_path}")
+    _write_subtitles(segments, vtt_path=output_path)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Exported VTT to: {output_path}")
 
 
 def export_json(transcript: Transcript, output_path: str) -> None:
@@ -96,35 +156,53 @@ def export_json(transcript: Transcript, output_path: str) -> None:
         transcript: Transcript object
         output_path: Output file path
     """
-    # Convert to dict using Pydantic's model_dump
-    data = transcript.model_dump()
-    
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        # orjson serializes the schema dataclasses natively
+        data = orjson.dumps(transcript, option=orjson.OPT_INDENT_2)
+        Path(output_path).write_bytes(data)
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(asdict(transcript), f, indent=2, ensure_ascii=False)
     
-    logger.info(f"Exported JSON to: {output_path}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Exported JSON to: {output_path}")
 
 
-def export_jsonl(chunks: List[Chunk], output_path: str) -> None:
+def export_jsonl(chunks: Iterable[Chunk], output_path: str) -> int:
     """
     Export chunks to JSONL format (one JSON object per line).
     
+    Chunks are written as they are produced, so a generator such as
+    TextChunker.iter_chunks is streamed without building a list.
+    
     Args:
-        chunks: List of chunks
+        chunks: Iterable of chunks
         output_path: Output file path
+    
+    Returns:
+        Number of chunks written
     """
-    with open(output_path, 'w', encoding='utf-8') as f:
-        for chunk in chunks:
-            # Convert to dict using Pydantic's model_dump
-            data = chunk.model_dump()
-            f.write(json.dumps(data, ensure_ascii=False) + "\n")
+    count = 0
+    if orjson is not None:
+        # orjson emits UTF-8 bytes directly, so write in binary mode
+        with open(output_path, 'wb') as f:
+            for chunk in chunks:
+                f.write(orjson.dumps(chunk) + b"\n")
+                count += 1
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            for chunk in chunks:
+                f.write(json.dumps(asdict(chunk), ensure_ascii=False) + "\n")
+                count += 1
     
-    logger.info(f"Exported JSONL to: {output_path} ({len(chunks)} chunks)")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Exported JSONL to: {output_path} ({count} chunks)")
+    return count
 
 
 def export_all(
     transcript: Transcript,
-    chunks: List[Chunk],
+    chunks: Iterable[Chunk],
     output_dir: str,
     base_name: str
 ) -> dict:
@@ -133,7 +211,7 @@ def export_all(
     
     Args:
         transcript: Transcript object
-        chunks: List of chunks
+        chunks: Iterable of chunks (consumed once)
         output_dir: Output directory
         base_name: Base name for output files (without extension)
     
@@ -145,14 +223,11 @@ def export_all(
     
     outputs = {}
     
-    # Export SRT
+    # Export SRT and VTT in a single pass over the segments
     srt_path = output_path / f"{base_name}.srt"
-    export_srt(transcript.segments, str(srt_path))
-    outputs['srt'] = str(srt_path)
-    
-    # Export VTT
     vtt_path = output_path / f"{base_name}.vtt"
-    export_vtt(transcript.segments, str(vtt_path))
+    _write_subtitles(transcript.segments, str(srt_path), str(vtt_path))
+    outputs['srt'] = str(srt_path)
     outputs['vtt'] = str(vtt_path)
     
     # Export JSON
@@ -165,13 +240,14 @@ def export_all(
     export_jsonl(chunks, str(jsonl_path))
     outputs['jsonl'] = str(jsonl_path)
     
-    logger.info(f"Exported all formats to: {output_dir}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Exported all formats to: {output_dir}")
     return outputs
 
 
 def export_formats(
     transcript: Transcript,
-    chunks: List[Chunk],
+    chunks: Iterable[Chunk],
     output_dir: str,
     base_name: str,
     formats: Iterable[str]
@@ -181,7 +257,7 @@ def export_formats(
 
     Args:
         transcript: Transcript object
-        chunks: List of chunks
+        chunks: Iterable of chunks (consumed once)
         output_dir: Output directory
         base_name: Base name for output files (without extension)
         formats: Iterable of format strings among {"srt","vtt","json","jsonl"}
@@ -196,15 +272,13 @@ def export_formats(
 
     fmt_set = {f.lower() for f in formats}
 
+    # SRT and VTT share a single pass over the segments
     if "srt" in fmt_set:
-        srt_path = output_path / f"{base_name}.srt"
-        export_srt(transcript.segments, str(srt_path))
-        outputs["srt"] = str(srt_path)
-
+        outputs["srt"] = str(output_path / f"{base_name}.srt")
     if "vtt" in fmt_set:
-        vtt_path = output_path / f"{base_name}.vtt"
-        export_vtt(transcript.segments, str(vtt_path))
-        outputs["vtt"] = str(vtt_path)
+        outputs["vtt"] = str(output_path / f"{base_name}.vtt")
+    if "srt" in outputs or "vtt" in outputs:
+        _write_subtitles(transcript.segments, outputs.get("srt"), outputs.get("vtt"))
 
     if "json" in fmt_set:
         json_path = output_path / f"{base_name}.json"
@@ -216,5 +290,6 @@ def export_formats(
         export_jsonl(chunks, str(jsonl_path))
         outputs["jsonl"] = str(jsonl_path)
 
-    logger.info(f"Exported selected formats ({', '.join(sorted(fmt_set))}) to: {output_dir}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Exported selected formats ({', '.join(sorted(fmt_set))}) to: {output_dir}")
     return outputs
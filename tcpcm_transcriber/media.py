@@ -1,22 +1,79 @@
 """Media handling utilities with optional ffmpeg probing."""
 
+import hashlib
+import json
 import logging
+import os
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+PROBE_CACHE_DIR = Path.home() / ".cache" / "tcpcm" / "probes"
+
+
+def _probe_cache_path(file_path: str) -> Path:
+    """Cache file for a media file, keyed by its path, mtime and size."""
+    stat = os.stat(file_path)
+    key = f"{Path(file_path).resolve()}|{stat.st_mtime_ns}|{stat.st_size}"
+    return PROBE_CACHE_DIR / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+
+def _read_probe_cache(cache_path: Path) -> Optional[Dict[str, Any]]:
+    """Read cached probe info, or None if missing or unreadable."""
+    try:
+        data = cache_path.read_bytes()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    except (OSError, ValueError):
+        return None
 
-def probe_media(file_path: str) -> Optional[Dict[str, Any]]:
+
+def _write_probe_cache(cache_path: Path, info: Dict[str, Any]) -> None:
+    """Write probe info to the cache, ignoring failures."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        if orjson is not None:
+            cache_path.write_bytes(orjson.dumps(info))
+        else:
+            cache_path.write_text(json.dumps(info), encoding='utf-8')
+    except OSError as e:
+        logger.debug(f"Could not write probe cache {cache_path}: {e}")
+
+
+def probe_media(file_path: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
     """
     Probe media file using ffmpeg.
     
+    Results are cached on disk under ~/.cache/tcpcm/probes/, keyed by the
+    file's path, modification time and size, so unchanged files are only
+    probed once.
+    
     Args:
         file_path: Path to media file
+        use_cache: Whether to read and write the probe cache
     
     Returns:
         Dictionary with media info or None if probe fails
     """
+    cache_path = None
+    if use_cache:
+        try:
+            cache_path = _probe_cache_path(file_path)
+        except OSError:
+            cache_path = None
+        if cache_path is not None:
+            info = _read_probe_cache(cache_path)
+            if info is not None:
+                logger.info(f"Media probe (cached): {info}")
+                return info
+    
     try:
         import ffmpeg
         
@@ -40,6 +97,8 @@ def probe_media(file_path: str) -> Optional[Dict[str, Any]]:
             info['sample_rate'] = audio_streams[0].get('sample_rate')
         
         logger.info(f"Media probe: {info}")
+        if cache_path is not None:
+            _write_probe_cache(cache_path, info)
         return info
         
     except ImportError:
@@ -50,6 +109,33 @@ def probe_media(file_path: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+def load_audio(file_path: str, sampling_rate: int = 16000) -> Optional[np.ndarray]:
+    """
+    Decode a media file to mono float32 samples for Whisper.
+    
+    Uses the same decoder faster-whisper applies to file paths, so passing
+    the result to the ASR engine is equivalent to passing the path. Meant to
+    run in a background thread while the model loads.
+    
+    Args:
+        file_path: Path to media file
+        sampling_rate: Target sample rate in Hz
+    
+    Returns:
+        1-D float32 array of samples, or None if decoding fails
+    """
+    try:
+        from faster_whisper import decode_audio
+        
+        audio = decode_audio(file_path, sampling_rate=sampling_rate)
+        logger.info(f"Decoded audio: {file_path} ({len(audio) / sampling_rate:.1f}s)")
+        return audio
+        
+    except Exception as e:
+        logger.warning(f"Failed to pre-decode audio, will decode during transcription: {e}")
+        return None
+
+
 def validate_media_file(file_path: str) -> bool:
     """
     Validate that a media file exists and is accessible.
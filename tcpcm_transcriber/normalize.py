@@ -1,18 +1,129 @@
 """Text normalization with glossary support and filler removal."""
 
 import re
+import functools
+import itertools
 import logging
-from typing import Dict, List
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
 from pathlib import Path
 import json
 
+try:
+    import ahocorasick
+except ImportError:  # optional speedup, see the [fast] extra
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
-# Common filler words to remove
-FILLER_WORDS = [
+# Common filler words to remove; a tuple, since the filler pattern is
+# compiled from it once at import (see _FILLER_PATTERN)
+FILLER_WORDS = (
     "um", "uh", "hmm", "mhm", "uh-huh", "mm-hmm",
     "like", "you know", "i mean", "sort of", "kind of"
-]
+)
+
+# Glossary used when no glossary path is given
+_DEFAULT_GLOSSARY_PATH = Path(__file__).parent / "glossary_default.json"
+
+# Parsed glossary files by resolved path, with the (mtime_ns, size) they were
+# read at, so unchanged files are not re-read by each new normalizer
+_glossary_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, str]]] = {}
+_glossary_cache_lock = threading.Lock()
+
+# Normalized results remembered per TextNormalizer; the cache starts over
+# once full
+_NORMALIZE_CACHE_SIZE = 4096
+
+# Joins texts in normalize_many; never part of a term and not whitespace,
+# so term matching and word boundaries behave as at string start/end.
+_TEXT_SEPARATOR = "\x00"
+
+# Regex and automaton matching hold the GIL, so threads only normalize in
+# parallel on free-threaded builds
+_GIL_ENABLED = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def _file_stamp(path: Path) -> Tuple[int, int]:
+    """Get the (mtime_ns, size) of a file, which changes when it is edited."""
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _glossary_stamp(glossary_path: Optional[str]) -> Optional[Tuple[int, int]]:
+    """Get the stamp of a glossary file (default if None), or None if it is missing."""
+    try:
+        return _file_stamp(Path(glossary_path) if glossary_path else _DEFAULT_GLOSSARY_PATH)
+    except OSError:
+        return None
+
+
+def _is_word_char(char: str) -> bool:
+    """Check whether char is a regex word character."""
+    return char.isalnum() or char == "_"
+
+
+# 1 for the regex word characters among the first 256 code points
+_LATIN1_WORD_TABLE = bytes(_is_word_char(chr(i)) for i in range(256))
+
+
+class _LazyWordMask:
+    """Word-character mask checked per lookup, for text beyond Latin-1."""
+    
+    __slots__ = ("text",)
+    
+    def __init__(self, text: str):
+        self.text = text
+    
+    def __getitem__(self, index: int) -> bool:
+        return 0 < index <= len(self.text) and _is_word_char(self.text[index - 1])
+
+
+def _word_mask(text: str):
+    """
+    Build a padded word-character mask of text.
+    
+    mask[i] is truthy when text[i - 1] is a word character; mask[0] and
+    mask[len(text) + 1] stand for the start and end of the text. Latin-1
+    text is converted in one C-level translate; other text is checked per
+    lookup.
+    """
+    try:
+        return b"\x00" + text.encode("latin-1").translate(_LATIN1_WORD_TABLE) + b"\x00"
+    except UnicodeEncodeError:
+        return _LazyWordMask(text)
+
+
+def _lower_aligned(text: str) -> str:
+    """Lowercase text, keeping every character at its original offset."""
+    text_lower = text.lower()
+    if len(text_lower) != len(text):
+        # A few characters lowercase to two (e.g. "İ" to "i" plus a combining
+        # dot); keep only the first, so they still match case-insensitively
+        text_lower = "".join([c.lower()[0] for c in text])
+    return text_lower
+
+
+def _split_on_terms(pattern: re.Pattern, text: str) -> List[str]:
+    """
+    Split text on the matches of a lowercase pattern, ignoring case.
+    
+    The pattern runs on the lowercased text, which is cheaper than an
+    IGNORECASE match. Even items are the original text between matches,
+    odd items the lowercased matches.
+    """
+    parts = pattern.split(_lower_aligned(text))
+    offsets = list(itertools.accumulate(map(len, parts), initial=0))
+    parts[0::2] = map(text.__getitem__, map(slice, offsets[0::2], offsets[1::2]))
+    return parts
 
 
 class TextNormalizer:
@@ -28,29 +139,59 @@ class TextNormalizer:
         """
         self.glossary = self._load_glossary(glossary_path)
         self.remove_fillers = remove_fillers
+        self._cache: Dict[str, str] = {}
         
-        # Create regex patterns for efficient matching
-        # Sort by length (longest first) to match longer phrases first
-        glossary_terms = sorted(self.glossary.keys(), key=len, reverse=True)
-        self.glossary_pattern = self._create_pattern(glossary_terms)
-        
-        if remove_fillers:
-            self.filler_pattern = self._create_pattern(FILLER_WORDS)
+        # Glossary terms and fillers are matched together in one left-to-right
+        # pass: with an Aho-Corasick automaton when available, regardless of
+        # glossary size, otherwise with one regex over all terms. Both take
+        # the leftmost match, preferring the longest term at each position,
+        # and replacements are never matched again.
+        if ahocorasick is not None:
+            self._automaton = self._create_automaton(
+                self.glossary,
+                FILLER_WORDS if remove_fillers else ()
+            )
+            self.terms_pattern = None
         else:
-            self.filler_pattern = None
+            self._automaton = None
+            
+            # Case-insensitive lookup of replacements, fillers mapping to "";
+            # the first of any keys differing only in case wins, and glossary
+            # terms take precedence over fillers
+            self._lc_map = {}
+            for key, value in self.glossary.items():
+                self._lc_map.setdefault(key.lower(), value)
+            if remove_fillers:
+                for filler in FILLER_WORDS:
+                    self._lc_map.setdefault(filler, "")
+            
+            if remove_fillers and not self.glossary:
+                self.terms_pattern = _FILLER_PATTERN
+            else:
+                self.terms_pattern = self._create_pattern(list(self._lc_map))
     
     def _load_glossary(self, glossary_path: str = None) -> Dict[str, str]:
-        """Load glossary from JSON file."""
+        """Load glossary from JSON file, reusing it while the file is unchanged."""
         if glossary_path is None:
             # Use default glossary in package
-            default_path = Path(__file__).parent / "glossary_default.json"
-            glossary_path = str(default_path)
+            glossary_path = str(_DEFAULT_GLOSSARY_PATH)
         
         try:
-            with open(glossary_path, 'r', encoding='utf-8') as f:
-                glossary = json.load(f)
+            path = Path(glossary_path).resolve()
+            stamp = _file_stamp(path)
+            
+            with _glossary_cache_lock:
+                cached = _glossary_cache.get(str(path))
+            if cached is not None and cached[0] == stamp:
+                return dict(cached[1])
+            
+            data = path.read_bytes()
+            glossary = orjson.loads(data) if orjson is not None else json.loads(data)
+            with _glossary_cache_lock:
+                _glossary_cache[str(path)] = (stamp, glossary)
+            
             logger.info(f"Loaded glossary with {len(glossary)} terms from {glossary_path}")
-            return glossary
+            return dict(glossary)
         except FileNotFoundError:
             logger.warning(f"Glossary file not found: {glossary_path}, using empty glossary")
             return {}
@@ -58,17 +199,77 @@ class TextNormalizer:
             logger.error(f"Failed to load glossary: {e}")
             return {}
     
-    def _create_pattern(self, terms: List[str]) -> re.Pattern:
-        """Create a compiled regex pattern from terms."""
-        # Escape special regex characters and join with OR
+    @staticmethod
+    def _create_pattern(terms: Sequence[str]) -> Optional[re.Pattern]:
+        """
+        Create a compiled regex pattern from terms, or None if there are none.
+        
+        Terms are lowercased and the pattern is case-sensitive, so it must
+        be matched against lowercased text (see _split_on_terms).
+        """
+        if not terms:
+            return None
+        
+        terms = list(dict.fromkeys(term.lower() for term in terms))
+        
+        # Single characters need no alternation: one character class test
+        if all(len(term) == 1 for term in terms):
+            chars = "".join(sorted({re.escape(term) for term in terms}))
+            return re.compile(r'\b([' + chars + r'])\b')
+        
+        # Sort by length (longest first) so longer phrases win over their
+        # prefixes (e.g. "uh-huh" over "uh"), then escape and join with OR
+        terms = sorted(terms, key=len, reverse=True)
         escaped_terms = [re.escape(term) for term in terms]
-        pattern_str = r'\b(' + '|'.join(escaped_terms) + r')\b'
-        return re.compile(pattern_str, re.IGNORECASE)
+        
+        # Lookahead on the terms' first characters, so most positions are
+        # rejected by one character-class test before the alternation runs
+        if all(terms):
+            first_chars = "".join(sorted({re.escape(term[0]) for term in terms}))
+            prefilter = r'(?=[' + first_chars + r'])'
+        else:
+            prefilter = ''
+        
+        pattern_str = r'\b' + prefilter + r'(' + '|'.join(escaped_terms) + r')\b'
+        return re.compile(pattern_str)
+    
+    def _create_automaton(
+        self,
+        glossary: Dict[str, str],
+        fillers: Sequence[str]
+    ) -> "ahocorasick.Automaton":
+        """
+        Create an Aho-Corasick automaton over lowercased terms.
+        
+        Glossary terms map to their canonical form and fillers map to the
+        empty string, so one scan handles both.
+        """
+        automaton = ahocorasick.Automaton()
+        terms = list(glossary.items())
+        terms.extend((filler, "") for filler in fillers)
+        for term, replacement in terms:
+            term_lower = term.lower()
+            # Keys differing only in case resolve to the first one, as in
+            # the regex path; glossary terms take precedence over fillers
+            if term_lower and not automaton.exists(term_lower):
+                automaton.add_word(term_lower, (
+                    len(term_lower),
+                    replacement,
+                    _is_word_char(term_lower[0]),
+                    _is_word_char(term_lower[-1]),
+                ))
+        
+        if not len(automaton):
+            return None
+        automaton.make_automaton()
+        return automaton
     
     def normalize(self, text: str) -> str:
         """
         Normalize text using glossary and filler removal.
         
+        Results are remembered, so repeated texts are normalized once.
+        
         Args:
             text: Input text
         
@@ -78,34 +279,171 @@ class TextNormalizer:
         if not text:
             return text
         
-        # Apply glossary replacements
-        if self.glossary:
-            text = self._apply_glossary(text)
+        cached = self._cache.get(text)
+        if cached is not None:
+            return cached
         
-        # Remove filler words
-        if self.remove_fillers and self.filler_pattern:
-            text = self._remove_fillers(text)
+        result = self._replace_terms(text)
         
         # Clean up extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        result = " ".join(result.split())
         
+        self._remember(text, result)
+        return result
+    
+    def normalize_many(self, texts: List[str]) -> List[str]:
+        """
+        Normalize a list of texts in one pass.
+        
+        The distinct texts are joined with a separator so each pattern
+        scans the whole batch once instead of once per text; repeated
+        texts are normalized once.
+        
+        Args:
+            texts: Input texts
+        
+        Returns:
+            Normalized texts, in the same order
+        """
+        if not texts:
+            return []
+        
+        unique = list(dict.fromkeys(texts))
+        if any(_TEXT_SEPARATOR in text for text in unique):
+            normalized = [self.normalize(text) for text in unique]
+        else:
+            joined = self._replace_terms(_TEXT_SEPARATOR.join(unique))
+            normalized = [" ".join(text.split()) for text in joined.split(_TEXT_SEPARATOR)]
+        
+        results = dict(zip(unique, normalized))
+        return [results[text] for text in texts]
+    
+    def normalize_segments(self, texts: List[str], workers: Optional[int] = None) -> List[str]:
+        """
+        Normalize segment texts, split across threads where that helps.
+        
+        Each thread normalizes one contiguous slice with normalize_many.
+        The threads share this normalizer: its patterns and automaton are
+        read-only after __init__, but its result cache is shared and
+        written to by normalize(), which normalize_many falls back to for
+        texts containing a NUL character. With the GIL enabled the threads
+        would take turns, so a single worker is the default there.
+        
+        Args:
+            texts: Input texts
+            workers: Number of threads. Defaults to the CPU count on
+                free-threaded Python builds, otherwise 1.
+        
+        Returns:
+            Normalized texts, in the same order
+        """
+        if workers is None:
+            workers = 1 if _GIL_ENABLED else os.cpu_count() or 1
+        workers = min(workers, len(texts))
+        if workers <= 1:
+            return self.normalize_many(texts)
+        
+        size = -(-len(texts) // workers)
+        slices = [texts[i:i + size] for i in range(0, len(texts), size)]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return [text for part in pool.map(self.normalize_many, slices) for text in part]
+    
+    def _remember(self, text: str, result: str) -> None:
+        """Cache a normalized result, starting over when the cache is full."""
+        # Clearing keeps this O(1); evicting one entry at a time from the
+        # front of a dict slows down as deleted slots pile up
+        if len(self._cache) >= _NORMALIZE_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[text] = result
+    
+    def _replace_terms(self, text: str) -> str:
+        """Apply glossary replacements and remove filler words."""
+        if self._automaton is not None:
+            return self._apply_automaton(text)
+        if self.terms_pattern is not None:
+            return self._apply_pattern(text)
         return text
     
-    def _apply_glossary(self, text: str) -> str:
-        """Apply glossary term replacements."""
-        def replace_func(match):
-            matched_text = match.group(0)
-            # Find the canonical form (case-insensitive lookup)
-            for key, value in self.glossary.items():
-                if key.lower() == matched_text.lower():
-                    return value
-            return matched_text
+    def _apply_pattern(self, text: str) -> str:
+        """Replace glossary terms and remove fillers in one regex pass."""
+        # Mapping the matched terms with C-level lookups avoids calling
+        # back into Python for every match, as sub() with a function would
+        parts = _split_on_terms(self.terms_pattern, text)
+        parts[1::2] = map(self._lc_map.__getitem__, parts[1::2])
+        return "".join(parts)
+    
+    def _apply_automaton(self, text: str) -> str:
+        """
+        Replace glossary terms and remove fillers in one automaton scan.
         
-        return self.glossary_pattern.sub(replace_func, text)
+        Matches _apply_pattern: terms must sit on word boundaries, and
+        non-overlapping matches are taken left to right, preferring the
+        longest term at each position.
+        """
+        text_lower = _lower_aligned(text)
+        mask = _word_mask(text)
+        
+        matches = []
+        for end, (length, replacement, starts_word, ends_word) in self._automaton.iter(text_lower):
+            start = end - length + 1
+            # A word boundary sits between a word and a non-word character,
+            # so each neighbour must differ in kind from the term's edge
+            if mask[start] != starts_word and mask[end + 2] != ends_word:
+                matches.append((start, -length, replacement))
+        
+        if not matches:
+            return text
+        
+        # Leftmost first, then longest
+        matches.sort()
+        
+        # Offsets are in characters, so the output is assembled from str
+        # slices; a UTF-8 bytearray buffer measured slower even for ASCII
+        # text, as every slice and replacement then has to be encoded
+        parts = []
+        pos = 0
+        for start, neg_length, replacement in matches:
+            if start < pos:
+                continue
+            parts.append(text[pos:start])
+            parts.append(replacement)
+            pos = start - neg_length
+        parts.append(text[pos:])
+        
+        return "".join(parts)
+
+
+# Shared by the regex-path normalizers that only remove fillers
+_FILLER_PATTERN = TextNormalizer._create_pattern(FILLER_WORDS)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_normalizer(
+    glossary_path: str = None,
+    remove_fillers: bool = True,
+    stamp: Optional[Tuple[int, int]] = None
+) -> TextNormalizer:
+    """
+    Build a TextNormalizer once per glossary path, filler setting and
+    glossary file stamp (see _glossary_stamp), so an edited, created or
+    deleted glossary file gets a new normalizer.
+    """
+    return TextNormalizer(glossary_path, remove_fillers)
+
+
+def get_default_normalizer(remove_fillers: bool = True) -> TextNormalizer:
+    """
+    Get the shared normalizer for the packaged default glossary.
+    
+    The normalizer is built once per process and filler setting.
     
-    def _remove_fillers(self, text: str) -> str:
-        """Remove filler words from text."""
-        return self.filler_pattern.sub('', text)
+    Args:
+        remove_fillers: Whether to remove filler words
+    
+    Returns:
+        Shared TextNormalizer
+    """
+    return _get_normalizer(None, remove_fillers, _glossary_stamp(None))
 
 
 def normalize_text(
@@ -116,6 +454,9 @@ def normalize_text(
     """
     Convenience function to normalize text.
     
+    The normalizer for each glossary path is built on first use and
+    reused by later calls until the glossary file changes.
+    
     Args:
         text: Input text
         glossary_path: Path to glossary JSON file
@@ -124,5 +465,5 @@ def normalize_text(
     Returns:
         Normalized text
     """
-    normalizer = TextNormalizer(glossary_path, remove_fillers)
+    normalizer = _get_normalizer(glossary_path, remove_fillers, _glossary_stamp(glossary_path))
     return normalizer.normalize(text)
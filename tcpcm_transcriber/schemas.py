@@ -1,10 +1,11 @@
-"""Pydantic schemas for transcription data structures."""
+"""Data classes for transcription data structures."""
 
+from dataclasses import dataclass, field
 from typing import List, Optional
-from pydantic import BaseModel, Field
 
 
-class Segment(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Segment:
     """A transcription segment with timing and text."""
     id: int
     start: float
@@ -12,33 +13,31 @@ class Segment(BaseModel):
     text: str
 
 
-class Transcript(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Transcript:
     """Complete transcript with metadata."""
     segments: List[Segment]
     language: Optional[str] = None
     duration: Optional[float] = None
 
 
-class Chunk(BaseModel):
-    """A text chunk for RAG ingestion with metadata."""
+@dataclass(slots=True, kw_only=True)
+class Chunk:
+    """
+    A text chunk for RAG ingestion with metadata.
+    
+    Example:
+        Chunk(chunk_id=0, text="Introduction to TcPCM...", start=0.0,
+              end=15.5, segment_ids=[0, 1, 2], source_file="video.mp4")
+    """
     chunk_id: int
     text: str
     start: float
     end: float
-    segment_ids: List[int] = Field(default_factory=list)
-    char_count: int
+    segment_ids: List[int] = field(default_factory=list)
     source_file: Optional[str] = None
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "chunk_id": 0,
-                "text": "Introduction to TcPCM...",
-                "start": 0.0,
-                "end": 15.5,
-                "segment_ids": [0, 1, 2],
-                "char_count": 1200,
-                "source_file": "video.mp4"
-            }
-        }
-    }
+    @property
+    def char_count(self) -> int:
+        """Number of characters in the chunk text."""
+        return len(self.text)
@@ -0,0 +1,247 @@
+"""Local model server that keeps an ASR engine loaded across CLI invocations.
+
+The server listens on a Unix socket and speaks newline-delimited JSON. Each
+request is one line:
+    
+    {"op": "info"}
+    {"op": "transcribe", "path": "/abs/video.mp4", "opts": {"language": "en"}}
+
+A transcribe request is answered with zero or more progress lines (when
+``opts.progress`` is true), one line per segment, and a final line:
+    
+    {"progress": {"time": 12.5, "segments": 3}}
+    {"segment": {"id": 0, "start": 0.0, "end": 2.5, "text": "..."}}
+    {"done": {"language": "en", "duration": 42.0}}
+
+Failures are reported as ``{"error": "..."}``.
+"""
+
+import json
+import logging
+import os
+import socket
+import socketserver
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Union
+
+import numpy as np
+
+from .schemas import Segment, Transcript
+
+logger = logging.getLogger(__name__)
+
+SOCKET_PATH = Path.home() / ".cache" / "tcpcm" / "sock"
+
+# Engine settings reported by the info op, so clients can tell whether the
+# loaded engine matches the options they were given
+ENGINE_SETTINGS = (
+    "backend", "compute_type", "beam_size", "vad_filter",
+    "batch_size", "cpu_threads", "num_workers",
+)
+
+
+def _send(wfile: Any, message: Dict[str, Any]) -> None:
+    """Write one JSON message line and flush it to the peer."""
+    wfile.write(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+    wfile.flush()
+
+
+def _is_listening(socket_path: Path) -> bool:
+    """Check whether a server is accepting connections on socket_path."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Handle the requests of one client connection until it disconnects."""
+    
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                op = request.get("op")
+                if op == "info":
+                    _send(self.wfile, self.server.info())
+                elif op == "transcribe":
+                    self._transcribe(request)
+                else:
+                    _send(self.wfile, {"error": f"Unknown op: {op}"})
+            except (BrokenPipeError, ConnectionResetError):
+                logger.warning("Client disconnected")
+                return
+            except Exception as e:
+                logger.exception("Request failed")
+                _send(self.wfile, {"error": str(e)})
+    
+    def _transcribe(self, request: Dict[str, Any]) -> None:
+        opts = request.get("opts") or {}
+        
+        def report_progress(current_time: float, segment_count: int):
+            _send(self.wfile, {"progress": {"time": current_time, "segments": segment_count}})
+        
+        transcript = self.server.engine.transcribe(
+            request["path"],
+            language=opts.get("language"),
+            progress_callback=report_progress if opts.get("progress") else None,
+        )
+        
+        for seg in transcript.segments:
+            _send(self.wfile, {"segment": asdict(seg)})
+        _send(self.wfile, {"done": {"language": transcript.language, "duration": transcript.duration}})
+
+
+class ModelServer(socketserver.UnixStreamServer):
+    """
+    Unix-socket server holding one loaded ASR engine.
+    
+    Requests are handled one at a time, so the engine is never used
+    concurrently. The socket file is removed when the server is closed.
+    """
+    
+    def __init__(self, engine: Any, socket_path: Union[str, Path] = SOCKET_PATH):
+        """
+        Bind the server socket.
+        
+        Args:
+            engine: Loaded ASR engine (see asr.create_engine)
+            socket_path: Path of the Unix socket to listen on
+        
+        Raises:
+            RuntimeError: If another server is already listening on socket_path
+        """
+        self.engine = engine
+        self.socket_path = Path(socket_path)
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # A socket file left behind by a server that died can be replaced
+        if self.socket_path.exists():
+            if _is_listening(self.socket_path):
+                raise RuntimeError(f"A model server is already running on {self.socket_path}")
+            self.socket_path.unlink()
+        
+        super().__init__(str(self.socket_path), _RequestHandler)
+        os.chmod(self.socket_path, 0o600)
+    
+    def info(self) -> Dict[str, Any]:
+        """Describe the loaded engine and its settings."""
+        info = {"model": self.engine.model_size, "device": self.engine.device}
+        info.update((name, getattr(self.engine, name, None)) for name in ENGINE_SETTINGS)
+        return info
+    
+    def server_close(self):
+        super().server_close()
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class RemoteEngine:
+    """Client for a ModelServer with the same transcribe interface as ASREngine."""
+    
+    def __init__(self, sock: socket.socket):
+        """
+        Wrap a connected socket and fetch the server's engine description.
+        
+        Args:
+            sock: Socket connected to a ModelServer
+        """
+        self._sock = sock
+        self._rfile = sock.makefile("rb")
+        self.info = next(self._request({"op": "info"}))
+        self.model_size = self.info["model"]
+        self.device = self.info["device"]
+        self.compute_type = self.info["compute_type"]
+    
+    def _request(self, message: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Send a request and yield the reply lines."""
+        self._sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+        for line in self._rfile:
+            reply = json.loads(line)
+            if "error" in reply:
+                raise RuntimeError(f"Model server error: {reply['error']}")
+            yield reply
+        raise ConnectionError("Model server closed the connection")
+    
+    def transcribe(
+        self,
+        audio_path: Union[str, np.ndarray],
+        language: Optional[str] = None,
+        progress_callback: Optional[Callable[[float, int], None]] = None,
+        total_duration: Optional[float] = None
+    ) -> Transcript:
+        """
+        Transcribe an audio/video file on the server.
+        
+        Args:
+            audio_path: Path to audio or video file. The server decodes the
+                file itself, so pre-decoded samples are not accepted.
+            language: Language code (e.g., 'en'). Auto-detect if None.
+            progress_callback: Optional callback function(current_time, segment_count)
+            total_duration: Unused; accepted for interface compatibility
+        
+        Returns:
+            Transcript object with segments
+        """
+        if isinstance(audio_path, np.ndarray):
+            raise TypeError("The model server transcribes files; pass a path instead of samples")
+        
+        request = {
+            "op": "transcribe",
+            "path": str(Path(audio_path).resolve()),
+            "opts": {"language": language, "progress": progress_callback is not None},
+        }
+        
+        segments = []
+        for reply in self._request(request):
+            if "progress" in reply:
+                if progress_callback:
+                    progress_callback(reply["progress"]["time"], reply["progress"]["segments"])
+            elif "segment" in reply:
+                segments.append(Segment(**reply["segment"]))
+            elif "done" in reply:
+                return Transcript(segments=segments, **reply["done"])
+    
+    def close(self) -> None:
+        """Close the connection to the server."""
+        self._rfile.close()
+        self._sock.close()
+
+
+def connect(
+    socket_path: Union[str, Path] = SOCKET_PATH,
+    timeout: float = 1.0
+) -> Optional[RemoteEngine]:
+    """
+    Connect to a running model server.
+    
+    Args:
+        socket_path: Path of the server's Unix socket
+        timeout: Seconds to wait for the server to answer. A server busy
+            with another client's request does not answer in time.
+    
+    Returns:
+        RemoteEngine, or None if no server is reachable
+    """
+    socket_path = Path(socket_path)
+    if not socket_path.exists():
+        return None
+    
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(str(socket_path))
+        engine = RemoteEngine(sock)
+    except (OSError, ValueError, StopIteration, RuntimeError) as e:
+        logger.debug(f"Model server at {socket_path} is not available: {e}")
+        sock.close()
+        return None
+    
+    # Transcription can take arbitrarily long once the server has answered
+    sock.settimeout(None)
+    return engine
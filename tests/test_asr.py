@@ -0,0 +1,57 @@
+"""Tests for the ASR engine wrapper."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from tcpcm_transcriber import asr
+from tcpcm_transcriber.asr import ASREngine
+
+
+class RecordingModel:
+    """WhisperModel stand-in that records transcribe arguments."""
+    
+    def __init__(self, *args, **kwargs):
+        self.calls = []
+    
+    def transcribe(self, audio, **kwargs):
+        self.calls.append(kwargs)
+        segments = [SimpleNamespace(start=0.0, end=2.5, text=" Welcome to TcPCM. ")]
+        return iter(segments), SimpleNamespace(language="en")
+
+
+class RecordingPipeline(RecordingModel):
+    """BatchedInferencePipeline stand-in that records transcribe arguments."""
+    
+    def __init__(self, model):
+        super().__init__()
+
+
+@pytest.fixture(autouse=True)
+def fake_whisper(monkeypatch):
+    """Replace faster-whisper's model classes so no weights are loaded."""
+    monkeypatch.setattr(asr, "WhisperModel", RecordingModel)
+    monkeypatch.setattr(asr, "BatchedInferencePipeline", RecordingPipeline)
+
+
+def test_batched_decoding_keeps_segment_timestamps():
+    """Test that batched decoding asks for Whisper timestamps, not one segment per chunk."""
+    engine = ASREngine(model_size="tiny", device="cuda", compute_type="int8_float16")
+    assert engine.batch_size == 8
+    
+    transcript = engine.transcribe("video.mp4", language="en")
+    
+    assert engine.pipeline.calls[0]["without_timestamps"] is False
+    assert engine.pipeline.calls[0]["batch_size"] == 8
+    assert [seg.text for seg in transcript.segments] == ["Welcome to TcPCM."]
+
+
+def test_sequential_decoding_without_batching():
+    """Test that batch size 1 or disabled VAD decodes sequentially."""
+    for engine in (
+        ASREngine(model_size="tiny", device="cpu", compute_type="int8"),
+        ASREngine(model_size="tiny", device="cuda", compute_type="int8_float16", vad_filter=False),
+    ):
+        assert engine.pipeline is None
+        engine.transcribe("video.mp4")
+        assert len(engine.model.calls) == 1
@@ -127,6 +127,33 @@ def test_single_segment():
     assert chunks[0].text.strip() == "Short text."
 
 
+def test_empty_segment_texts():
+    """Test that empty segments neither produce nor truncate chunks."""
+    segments = [Segment(id=i, start=float(i), end=i + 1.0, text="") for i in range(40)]
+    segments.append(Segment(id=40, start=40.0, end=45.0, text="Text after a long pause."))
+    chunker = TextChunker(target_chars=20, overlap_chars=5)
+    
+    chunks = chunker.chunk_segments(segments)
+    
+    assert chunks
+    assert all(chunk.text for chunk in chunks)
+    assert chunks[-1].segment_ids[-1] == 40
+    assert "pause." in chunks[-1].text
+
+
+def test_iter_chunks_is_lazy():
+    """Test that iter_chunks yields the same chunks as chunk_segments, lazily."""
+    segments = create_test_segments()
+    chunker = TextChunker(target_chars=50, overlap_chars=10)
+    
+    chunk_iter = chunker.iter_chunks(segments, source_file="test.mp4")
+    
+    assert not isinstance(chunk_iter, list)
+    assert next(chunk_iter) == chunker.chunk_segments(segments, source_file="test.mp4")[0]
+    assert list(chunker.iter_chunks(segments)) == chunker.chunk_segments(segments)
+    assert list(chunker.iter_chunks([])) == []
+
+
 def test_target_chars_validation():
     """Test that overlap must be less than target."""
     with pytest.raises(ValueError):
@@ -174,3 +201,38 @@ def test_long_segments():
     for chunk in chunks:
         # Chunks should be around target size or less
         assert chunk.char_count <= chunker.target_chars * 1.1  # Allow 10% tolerance
+
+
+def test_chunk_text_covered_by_segments():
+    """Test that each chunk's text comes from its listed segments."""
+    segments = [
+        Segment(id=i, start=i * 2.0, end=i * 2.0 + 2.0, text=" ".join(f"s{i}w{j}" for j in range(i % 4 + 1)))
+        for i in range(20)
+    ]
+    chunker = TextChunker(target_chars=40, overlap_chars=10)
+    
+    chunks = chunker.chunk_segments(segments)
+    
+    for chunk in chunks:
+        covered = " ".join(segments[i].text for i in chunk.segment_ids)
+        assert chunk.text in covered
+
+
+def test_final_chunk_is_full_length():
+    """Test that the last window is aligned to the end of the text."""
+    long_text = "A" * 100
+    segments = [
+        Segment(id=0, start=0.0, end=10.0, text=long_text),
+        Segment(id=1, start=10.0, end=20.0, text=long_text),
+        Segment(id=2, start=20.0, end=30.0, text=long_text),
+    ]
+    
+    chunker = TextChunker(target_chars=150, overlap_chars=30)
+    chunks = chunker.chunk_segments(segments)
+    
+    # 302 chars with a stride of 120 needs 3 windows; the last one covers
+    # the final 150 chars instead of a 62-char tail
+    assert len(chunks) == 3
+    assert chunks[-1].char_count == 150
+    assert chunks[-1].segment_ids == [1, 2]
+    assert chunks[-1].end == 30.0
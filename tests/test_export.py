@@ -3,7 +3,9 @@
 import pytest
 import json
 import tempfile
+from dataclasses import asdict
 from pathlib import Path
+from tcpcm_transcriber import export
 from tcpcm_transcriber.schemas import Segment, Transcript, Chunk
 from tcpcm_transcriber.export import (
     format_timestamp_srt,
@@ -12,6 +14,7 @@ from tcpcm_transcriber.export import (
     export_vtt,
     export_json,
     export_jsonl,
+    export_all,
 )
 
 
@@ -51,6 +54,16 @@ def test_format_timestamp_vtt():
     assert format_timestamp_vtt(3723.456) == "01:02:03.456"
 
 
+def test_format_timestamp_rounding():
+    """Test that float artifacts round to the nearest millisecond."""
+    # 2.3 * 1000 and 1.001 * 1000 are not exact in binary floating point
+    assert format_timestamp_srt(2.3) == "00:00:02,300"
+    assert format_timestamp_vtt(1.001) == "00:00:01.001"
+    
+    # Rounding carries into seconds/minutes/hours
+    assert format_timestamp_srt(3599.9996) == "01:00:00,000"
+
+
 def test_export_srt():
     """Test SRT export."""
     segments = [
@@ -143,7 +156,6 @@ def test_export_jsonl():
             start=0.0,
             end=5.0,
             segment_ids=[0],
-            char_count=11,
             source_file="test.mp4"
         ),
         Chunk(
@@ -152,7 +164,6 @@ def test_export_jsonl():
             start=5.0,
             end=10.0,
             segment_ids=[1],
-            char_count=12,
             source_file="test.mp4"
         ),
     ]
@@ -176,5 +187,84 @@ def test_export_jsonl():
         assert chunk2['chunk_id'] == 1
         assert chunk2['text'] == 'Second chunk'
         
+        # char_count is derived from text and not stored
+        assert 'char_count' not in chunk1
+        
     finally:
         Path(output_path).unlink()
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_exports_with_and_without_orjson(monkeypatch, tmp_path, use_orjson):
+    """Test that JSON/JSONL output is the same with or without orjson."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(export, "orjson", None)
+    
+    transcript = Transcript(
+        segments=[Segment(id=0, start=0.0, end=5.0, text="Kalkulation für Werkzeugkosten")],
+        language="de",
+        duration=5.0
+    )
+    chunks = [
+        Chunk(
+            chunk_id=0,
+            text="Kalkulation für Werkzeugkosten",
+            start=0.0,
+            end=5.0,
+            segment_ids=[0],
+            source_file="test.mp4"
+        )
+    ]
+    
+    json_path = tmp_path / "out.json"
+    jsonl_path = tmp_path / "out.jsonl"
+    export_json(transcript, str(json_path))
+    export_jsonl(chunks, str(jsonl_path))
+    
+    # Non-ASCII text is written as UTF-8, not escaped
+    assert "für" in json_path.read_text(encoding="utf-8")
+    assert "für" in jsonl_path.read_text(encoding="utf-8")
+    
+    assert json.loads(json_path.read_text(encoding="utf-8")) == asdict(transcript)
+    assert json.loads(jsonl_path.read_text(encoding="utf-8")) == asdict(chunks[0])
+
+
+def test_export_all_matches_individual_exports(tmp_path):
+    """Test that the fused export_all writes the same subtitles as export_srt/export_vtt."""
+    transcript = Transcript(
+        segments=[
+            Segment(id=i, start=i * 2.345, end=i * 2.345 + 2.0, text=f"Segment {i}")
+            for i in range(50)
+        ],
+        language="en",
+        duration=117.25
+    )
+    
+    outputs = export_all(transcript, [], str(tmp_path), "fused")
+    export_srt(transcript.segments, str(tmp_path / "single.srt"))
+    export_vtt(transcript.segments, str(tmp_path / "single.vtt"))
+    
+    assert Path(outputs['srt']).read_text() == (tmp_path / "single.srt").read_text()
+    assert Path(outputs['vtt']).read_text() == (tmp_path / "single.vtt").read_text()
+
+
+def test_export_jsonl_streams_generator(tmp_path):
+    """Test that export_jsonl accepts a generator and returns the count."""
+    def generate():
+        for i in range(3):
+            yield Chunk(
+                chunk_id=i,
+                text=f"Chunk {i}",
+                start=float(i),
+                end=i + 1.0,
+                segment_ids=[i],
+            )
+    
+    output_path = tmp_path / "chunks.jsonl"
+    count = export_jsonl(generate(), str(output_path))
+    
+    lines = output_path.read_text().strip().split('\n')
+    assert count == 3
+    assert [json.loads(line)['chunk_id'] for line in lines] == [0, 1, 2]
@@ -49,8 +49,9 @@ def test_full_pipeline():
     
     try:
         normalizer = TextNormalizer(glossary_path=glossary_path, remove_fillers=True)
-        for seg in transcript.segments:
-            seg.text = normalizer.normalize(seg.text)
+        texts = normalizer.normalize_many([seg.text for seg in transcript.segments])
+        for seg, text in zip(transcript.segments, texts):
+            seg.text = text
         
         # Verify normalization worked
         assert "TcPCM" in transcript.segments[0].text
@@ -0,0 +1,95 @@
+"""Tests for media probing."""
+
+import os
+import sys
+import types
+import wave
+
+import numpy as np
+import pytest
+from tcpcm_transcriber import media
+from tcpcm_transcriber.media import load_audio, probe_media
+
+
+@pytest.fixture
+def fake_ffmpeg(monkeypatch, tmp_path):
+    """Replace ffmpeg.probe with a counting fake and isolate the probe cache."""
+    calls = []
+    
+    def probe(file_path):
+        calls.append(file_path)
+        return {
+            'format': {'format_name': 'mov,mp4', 'duration': '12.5'},
+            'streams': [{'codec_type': 'audio', 'codec_name': 'aac', 'sample_rate': '48000'}],
+        }
+    
+    monkeypatch.setitem(sys.modules, 'ffmpeg', types.SimpleNamespace(probe=probe))
+    monkeypatch.setattr(media, 'PROBE_CACHE_DIR', tmp_path / 'probes')
+    return calls
+
+
+def test_probe_media_uses_cache(fake_ffmpeg, tmp_path):
+    """Test that an unchanged file is only probed once."""
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"data")
+    
+    first = probe_media(str(video))
+    second = probe_media(str(video))
+    
+    assert first == second
+    assert first['duration'] == 12.5
+    assert first['audio_codec'] == 'aac'
+    assert len(fake_ffmpeg) == 1
+
+
+def test_probe_media_cache_invalidated_on_change(fake_ffmpeg, tmp_path):
+    """Test that modifying the file triggers a fresh probe."""
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"data")
+    probe_media(str(video))
+    
+    video.write_bytes(b"different data")
+    stat = video.stat()
+    os.utime(video, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    probe_media(str(video))
+    
+    assert len(fake_ffmpeg) == 2
+
+
+def test_probe_media_without_cache(fake_ffmpeg, tmp_path):
+    """Test that the cache can be bypassed."""
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"data")
+    
+    probe_media(str(video), use_cache=False)
+    probe_media(str(video), use_cache=False)
+    
+    assert len(fake_ffmpeg) == 2
+    assert not (tmp_path / 'probes').exists()
+
+
+def test_load_audio_resamples_to_mono_16k(tmp_path):
+    """Test that audio is decoded to 16 kHz mono float32 samples."""
+    pytest.importorskip("faster_whisper")
+    
+    # One second of stereo 44.1 kHz silence
+    wav_path = tmp_path / "tone.wav"
+    with wave.open(str(wav_path), 'wb') as w:
+        w.setnchannels(2)
+        w.setsampwidth(2)
+        w.setframerate(44100)
+        w.writeframes(np.zeros(44100 * 2, dtype=np.int16).tobytes())
+    
+    audio = load_audio(str(wav_path))
+    
+    assert audio.dtype == np.float32
+    assert audio.ndim == 1
+    assert abs(len(audio) - 16000) < 160
+
+
+def test_load_audio_returns_none_on_failure(tmp_path):
+    """Test that undecodable input returns None instead of raising."""
+    bad = tmp_path / "not_media.mp4"
+    bad.write_bytes(b"not a media file")
+    
+    assert load_audio(str(bad)) is None
@@ -4,7 +4,8 @@ import pytest
 import json
 import tempfile
 from pathlib import Path
-from tcpcm_transcriber.normalize import TextNormalizer, normalize_text
+from tcpcm_transcriber import normalize
+from tcpcm_transcriber.normalize import TextNormalizer, get_default_normalizer, normalize_text
 
 
 def test_glossary_mapping():
@@ -97,6 +98,86 @@ def test_convenience_function():
         Path(glossary_path).unlink()
 
 
+def test_convenience_function_reuses_normalizer(monkeypatch):
+    """Test that repeated calls don't reload the glossary."""
+    normalize._get_normalizer.cache_clear()
+    loads = []
+    original = TextNormalizer._load_glossary
+    
+    def counting_load(self, glossary_path=None):
+        loads.append(glossary_path)
+        return original(self, glossary_path)
+    
+    monkeypatch.setattr(TextNormalizer, "_load_glossary", counting_load)
+    
+    assert normalize_text("um tc pcm is great") == "TcPCM is great"
+    assert normalize_text("teamcenter pcm") == "TcPCM"
+    assert normalize_text("um okay", remove_fillers=False) == "um okay"
+    assert len(loads) == 2
+
+
+def test_glossary_file_cached_until_changed(monkeypatch, tmp_path):
+    """Test that an unchanged glossary is parsed once and an edited one reloaded."""
+    glossary_path = tmp_path / "glossary.json"
+    glossary_path.write_text(json.dumps({"tc pcm": "TcPCM"}))
+    TextNormalizer(glossary_path=str(glossary_path))
+    
+    def fail_read(self):
+        raise AssertionError("glossary re-read")
+    
+    monkeypatch.setattr(Path, "read_bytes", fail_read)
+    normalizer = TextNormalizer(glossary_path=str(glossary_path))
+    assert normalizer.normalize("tc pcm") == "TcPCM"
+    monkeypatch.undo()
+    
+    # Editing the file changes its size, so it is read again
+    glossary_path.write_text(json.dumps({"tc pcm": "TcPCM", "bom": "BOM"}))
+    normalizer = TextNormalizer(glossary_path=str(glossary_path))
+    assert normalizer.normalize("tc pcm bom") == "TcPCM BOM"
+
+
+def test_convenience_function_picks_up_glossary_changes(tmp_path):
+    """Test that normalize_text rebuilds its normalizer when the glossary file changes."""
+    glossary_path = tmp_path / "glossary.json"
+    
+    # A missing file gives an empty glossary until it is created
+    assert normalize_text("bom", glossary_path=str(glossary_path)) == "bom"
+    glossary_path.write_text(json.dumps({"bom": "BOM"}))
+    assert normalize_text("bom", glossary_path=str(glossary_path)) == "BOM"
+    
+    glossary_path.write_text(json.dumps({"bom": "Bill of Materials"}))
+    assert normalize_text("bom", glossary_path=str(glossary_path)) == "Bill of Materials"
+    
+    glossary_path.unlink()
+    assert normalize_text("bom", glossary_path=str(glossary_path)) == "bom"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_glossary_load_with_and_without_orjson(monkeypatch, tmp_path, use_orjson):
+    """Test that glossaries load the same with either JSON parser."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(normalize, "orjson", None)
+    
+    glossary_path = tmp_path / "glossary.json"
+    glossary_path.write_text(json.dumps({"werkzeugkosten": "Werkzeugkosten für Teile"}), encoding="utf-8")
+    normalizer = TextNormalizer(glossary_path=str(glossary_path), remove_fillers=False)
+    
+    assert normalizer.glossary == {"werkzeugkosten": "Werkzeugkosten für Teile"}
+    
+    # Malformed files fall back to an empty glossary with either parser
+    glossary_path.write_text("{not json")
+    assert TextNormalizer(glossary_path=str(glossary_path)).glossary == {}
+
+
+def test_default_normalizer_is_shared():
+    """Test that the default-glossary normalizer is built once per setting."""
+    assert get_default_normalizer() is get_default_normalizer()
+    assert get_default_normalizer(remove_fillers=False) is not get_default_normalizer()
+    assert get_default_normalizer().normalize("um teamcenter pcm") == "TcPCM"
+
+
 def test_case_preservation_in_replacement():
     """Test that replacements preserve the correct case."""
     glossary = {"tcpcm": "TcPCM"}
@@ -115,3 +196,131 @@ def test_case_preservation_in_replacement():
         
     finally:
         Path(glossary_path).unlink()
+
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_glossary_matching_with_and_without_automaton(monkeypatch, tmp_path, use_automaton):
+    """Test that the Aho-Corasick and regex glossary paths agree."""
+    if use_automaton:
+        pytest.importorskip("ahocorasick")
+    else:
+        monkeypatch.setattr(normalize, "ahocorasick", None)
+    
+    glossary_path = tmp_path / "glossary.json"
+    glossary_path.write_text(json.dumps({
+        "sap": "SAP",
+        "sap s4": "SAP S/4",
+        "api": "API",
+        "blue": "kind of Blue",
+        "mean time": "Mean Time",
+    }))
+    normalizer = TextNormalizer(glossary_path=str(glossary_path), remove_fillers=True)
+    assert (normalizer._automaton is not None) == use_automaton
+    
+    # Longest term wins, but only where it ends on a word boundary
+    assert normalizer.normalize("sap s4 rollout") == "SAP S/4 rollout"
+    assert normalizer.normalize("sap s4hana and sap") == "SAP s4hana and SAP"
+    # Terms inside words are left alone
+    assert normalizer.normalize("apis use the api.") == "apis use the API."
+    assert normalizer.normalize("my_api rapid API") == "my_api rapid API"
+    assert normalizer.normalize("überapi über api") == "überapi über API"
+    assert normalizer.normalize("Ωapi Ω api") == "Ωapi Ω API"
+    # Fillers are removed in the same pass
+    assert normalizer.normalize("um the sap, like, api") == "the SAP, , API"
+    # Replacements are not matched again, even if they contain a filler
+    assert normalizer.normalize("blue") == "kind of Blue"
+    # The leftmost of overlapping terms and fillers wins
+    assert normalizer.normalize("i mean time") == "time"
+    assert normalizer.normalize("the mean time") == "the Mean Time"
+    # Matching ignores case, even where lowercasing changes a string's length
+    assert normalizer.normalize("İ Like SAP S4") == "İ SAP S/4"
+    assert normalizer.normalize("İ MEAN it, İ api") == "it, İ API"
+
+
+def test_normalize_results_are_cached(monkeypatch):
+    """Test that repeated texts are normalized once and the cache stays bounded."""
+    monkeypatch.setattr(normalize, "_NORMALIZE_CACHE_SIZE", 3)
+    normalizer = TextNormalizer(glossary_path=None, remove_fillers=True)
+    calls = []
+    original = normalizer._replace_terms
+    
+    def counting_replace(text):
+        calls.append(text)
+        return original(text)
+    
+    monkeypatch.setattr(normalizer, "_replace_terms", counting_replace)
+    
+    assert normalizer.normalize("um okay") == "okay"
+    assert normalizer.normalize("um okay") == "okay"
+    assert len(calls) == 1
+    
+    for text in ["tc pcm", "right", "so um", "yes"]:
+        normalizer.normalize(text)
+    assert len(normalizer._cache) <= 3
+    
+    # Duplicates within a batch are normalized once
+    texts = ["um okay", "tc pcm", "right", "tc pcm", "um okay"]
+    assert normalizer.normalize_many(texts) == ["okay", "TcPCM", "right", "TcPCM", "okay"]
+    assert calls[-1].count("okay") == 1
+
+
+def test_create_pattern_specializations():
+    """Test that empty and single-character term lists get simpler patterns."""
+    normalizer = TextNormalizer(glossary_path=None, remove_fillers=False)
+    
+    assert normalizer._create_pattern([]) is None
+    
+    pattern = normalizer._create_pattern(["x", "Y"])
+    assert "|" not in pattern.pattern
+    # Patterns hold lowercased terms and match lowercased text
+    assert pattern.sub("-", "x y xy x, y.") == "- - xy -, -."
+    assert pattern.sub("-", "X") == "X"
+
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_filler_only_normalizer_with_and_without_automaton(monkeypatch, use_automaton):
+    """Test that an empty glossary still removes fillers on both paths."""
+    if use_automaton:
+        pytest.importorskip("ahocorasick")
+    else:
+        monkeypatch.setattr(normalize, "ahocorasick", None)
+    
+    normalizer = TextNormalizer(glossary_path="missing.json", remove_fillers=True)
+    if not use_automaton:
+        assert normalizer.terms_pattern is normalize._FILLER_PATTERN
+    assert normalizer.normalize("um so, you know, tc pcm") == "so, , tc pcm"
+
+
+def test_longer_filler_wins_over_prefix():
+    """Test that multi-part fillers are removed whole, not just their prefix."""
+    normalizer = TextNormalizer(glossary_path=None, remove_fillers=True)
+    
+    assert normalizer.normalize("uh-huh that is right") == "that is right"
+    assert normalizer.normalize("mm-hmm okay") == "okay"
+
+
+def test_normalize_many_matches_normalize():
+    """Test that batch normalization gives the same results as per-text."""
+    normalizer = TextNormalizer(glossary_path=None, remove_fillers=True)
+    
+    texts = [
+        "Welcome to tc pcm training.",
+        "",
+        "um so like you know",
+        "tc",  # must not join with the next text into "tc pcm"
+        "pcm  with   spaces ",
+        "uh-huh teamcenter pcm",
+    ]
+    
+    assert normalizer.normalize_many(texts) == [normalizer.normalize(t) for t in texts]
+    assert normalizer.normalize_many([]) == []
+
+
+@pytest.mark.parametrize("workers", [None, 1, 4, 100])
+def test_normalize_segments_matches_normalize(workers):
+    """Test that threaded normalization keeps results and their order."""
+    normalizer = TextNormalizer(glossary_path=None, remove_fillers=True)
+    texts = [f"um segment {i} about tc pcm" for i in range(10)] + ["", "like teamcenter pcm"]
+    
+    assert normalizer.normalize_segments(texts, workers=workers) == [normalizer.normalize(t) for t in texts]
+    assert normalizer.normalize_segments([], workers=workers) == []
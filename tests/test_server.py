@@ -0,0 +1,161 @@
+"""Tests for the model server."""
+
+import socket
+import threading
+
+import numpy as np
+import pytest
+
+if not hasattr(socket, "AF_UNIX"):
+    pytest.skip("requires Unix sockets", allow_module_level=True)
+
+from tcpcm_transcriber.cli import _connect_server
+from tcpcm_transcriber.schemas import Segment, Transcript
+from tcpcm_transcriber.server import ModelServer, connect
+
+
+class FakeEngine:
+    """Engine stand-in that returns a fixed transcript."""
+    
+    model_size = "tiny"
+    device = "cpu"
+    backend = "faster-whisper"
+    compute_type = "int8"
+    beam_size = 5
+    vad_filter = True
+    batch_size = 1
+    cpu_threads = 4
+    num_workers = 1
+    
+    def __init__(self):
+        self.calls = []
+    
+    def transcribe(self, audio_path, language=None, progress_callback=None, total_duration=None):
+        self.calls.append((audio_path, language))
+        if audio_path.endswith("broken.mp4"):
+            raise ValueError("cannot decode")
+        
+        segments = [
+            Segment(id=0, start=0.0, end=2.5, text="Welcome to TcPCM."),
+            Segment(id=1, start=2.5, end=5.0, text="Let's begin."),
+        ]
+        for i, seg in enumerate(segments, 1):
+            if progress_callback:
+                progress_callback(seg.end, i)
+        return Transcript(segments=segments, language="en", duration=5.0)
+
+
+@pytest.fixture
+def server(tmp_path):
+    """Run a model server with a fake engine in a background thread."""
+    engine = FakeEngine()
+    model_server = ModelServer(engine, tmp_path / "sock")
+    thread = threading.Thread(target=model_server.serve_forever, daemon=True)
+    thread.start()
+    yield model_server
+    model_server.shutdown()
+    model_server.server_close()
+    thread.join()
+
+
+def test_remote_transcribe_matches_engine(server, tmp_path):
+    """Test that a transcript round-trips through the server."""
+    remote = connect(server.socket_path)
+    assert remote.model_size == "tiny"
+    
+    progress = []
+    transcript = remote.transcribe(
+        str(tmp_path / "video.mp4"),
+        language="en",
+        progress_callback=lambda t, n: progress.append((t, n)),
+    )
+    remote.close()
+    
+    assert transcript == server.engine.transcribe("video.mp4")
+    assert progress == [(2.5, 1), (5.0, 2)]
+    assert server.engine.calls[0] == (str(tmp_path / "video.mp4"), "en")
+
+
+def test_server_reports_engine_settings(server):
+    """Test that the info op describes the engine's settings."""
+    remote = connect(server.socket_path)
+    remote.close()
+    
+    assert remote.info == {
+        "model": "tiny",
+        "device": "cpu",
+        "backend": "faster-whisper",
+        "compute_type": "int8",
+        "beam_size": 5,
+        "vad_filter": True,
+        "batch_size": 1,
+        "cpu_threads": 4,
+        "num_workers": 1,
+    }
+
+
+def test_connect_server_requires_matching_settings(server):
+    """Test that the CLI only uses a server with the requested model and options."""
+    remote = _connect_server("tiny", {}, server.socket_path)
+    assert remote is not None
+    remote.close()
+    
+    remote = _connect_server("tiny", {"beam_size": 5, "vad_filter": True}, server.socket_path)
+    assert remote is not None
+    remote.close()
+    
+    # Another model, or any explicitly requested setting that differs
+    assert _connect_server("large", {}, server.socket_path) is None
+    assert _connect_server("tiny", {"beam_size": 1}, server.socket_path) is None
+    assert _connect_server("tiny", {"vad_filter": False}, server.socket_path) is None
+    assert _connect_server("tiny", {"backend": "openvino"}, server.socket_path) is None
+
+
+def test_engine_reused_across_connections(server, tmp_path):
+    """Test that several clients share the one loaded engine."""
+    for _ in range(3):
+        remote = connect(server.socket_path)
+        remote.transcribe(str(tmp_path / "video.mp4"))
+        remote.close()
+    
+    assert len(server.engine.calls) == 3
+
+
+def test_remote_errors_are_raised(server, tmp_path):
+    """Test that server-side failures surface on the client."""
+    remote = connect(server.socket_path)
+    
+    with pytest.raises(RuntimeError, match="cannot decode"):
+        remote.transcribe(str(tmp_path / "broken.mp4"))
+    with pytest.raises(TypeError):
+        remote.transcribe(np.zeros(16000, dtype=np.float32))
+    
+    # The connection stays usable after an error
+    assert len(remote.transcribe(str(tmp_path / "video.mp4")).segments) == 2
+    remote.close()
+
+
+def test_connect_without_server(tmp_path):
+    """Test that a missing or stale socket yields no connection."""
+    socket_path = tmp_path / "sock"
+    assert connect(socket_path) is None
+    
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(socket_path))
+    stale.close()
+    assert socket_path.exists()
+    assert connect(socket_path) is None
+
+
+def test_server_replaces_stale_socket(tmp_path):
+    """Test that a socket left by a dead server is reused, a live one is not."""
+    socket_path = tmp_path / "sock"
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(socket_path))
+    stale.close()
+    
+    with ModelServer(FakeEngine(), socket_path):
+        with pytest.raises(RuntimeError, match="already running"):
+            ModelServer(FakeEngine(), socket_path)
+    
+    assert not socket_path.exists()